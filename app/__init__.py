@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import importlib
+import copy
 import json
-import pkgutil
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
 
 import yaml
-from flask import Flask, render_template, request
+from flask import Flask, g, render_template, request
 
 from common.errors import AppError, ensure_app_error
 from common.logging import install_request_logging
@@ -18,16 +20,30 @@ from common.responses import fail
 
 from . import config as config_module
 from .blueprints import register_plugin_blueprints
+from .plugins_loader import PluginRecord, discover_plugins
 
-CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yml"
-MANIFEST_PATH = (
-    Path(__file__).resolve().parent / "ui" / "static" / "react" / "manifest.json"
-)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_APP_ROOT = Path(__file__).resolve().parent
+_REPO_ROOT = _APP_ROOT.parent
+CONFIG_PATH = _REPO_ROOT / "config.yml"
+MANIFEST_PATH = _APP_ROOT / "ui" / "static" / "react" / "manifest.json"
+
+
+@lru_cache(maxsize=32)
+def _encoded_theme(theme: str) -> str:
+    return quote_plus(theme)
 
 
 def _append_theme_param(url: str, theme: str, host: str | None = None) -> str:
     if not url or not theme:
         return url
+    if url[0] == "/" and not url.startswith("//") and "?" not in url and "#" not in url:
+        # Relative link without query or fragment: nothing to merge.
+        return f"{url}?theme={_encoded_theme(theme)}"
     try:
         parsed = urlsplit(url)
     except ValueError:
@@ -43,19 +59,41 @@ def _append_theme_param(url: str, theme: str, host: str | None = None) -> str:
     )
 
 
-def _load_vite_manifest() -> dict:
-    manifest_path = MANIFEST_PATH
-    if not manifest_path.exists():
-        alt_path = MANIFEST_PATH.parent / ".vite" / "manifest.json"
-        if alt_path.exists():
-            manifest_path = alt_path
-        else:
-            return {}
+def _vite_manifest_path() -> Path | None:
+    if MANIFEST_PATH.exists():
+        return MANIFEST_PATH
+    alt_path = MANIFEST_PATH.parent / ".vite" / "manifest.json"
+    if alt_path.exists():
+        return alt_path
+    return None
+
+
+@lru_cache(maxsize=4)
+def _read_vite_manifest(manifest_path: Path, mtime_ns: int) -> dict:
     try:
         with manifest_path.open("r", encoding="utf-8") as handle:
             return json.load(handle)
-    except json.JSONDecodeError:
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _vite_manifest_key() -> tuple[Path | None, int]:
+    manifest_path = _vite_manifest_path()
+    if manifest_path is None:
+        return None, -1
+    try:
+        return manifest_path, manifest_path.stat().st_mtime_ns
+    except OSError:
+        return None, -1
+
+
+def _load_vite_manifest() -> dict:
+    """Return the parsed Vite manifest, cached until the file changes."""
+
+    manifest_path, mtime_ns = _vite_manifest_key()
+    if manifest_path is None:
         return {}
+    return _read_vite_manifest(manifest_path, mtime_ns)
 
 
 def _resolve_assets(manifest: dict) -> dict:
@@ -82,31 +120,73 @@ def _resolve_assets(manifest: dict) -> dict:
     return {"scripts": scripts, "styles": styles, "preload": preload}
 
 
+@lru_cache(maxsize=4)
+def _resolve_cached_assets(
+    manifest_path: Path | None, mtime_ns: int
+) -> Mapping[str, tuple[str, ...]]:
+    if manifest_path is None:
+        assets = _resolve_assets({})
+    else:
+        assets = _resolve_assets(_read_vite_manifest(manifest_path, mtime_ns))
+    # The cached value is shared by every app instance, so it is read-only.
+    return MappingProxyType({kind: tuple(paths) for kind, paths in assets.items()})
+
+
+def _react_assets() -> Mapping[str, tuple[str, ...]]:
+    """Return the resolved React bundle assets shared by every app instance."""
+
+    return _resolve_cached_assets(*_vite_manifest_key())
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml_config(config_path: Path, mtime_ns: int) -> dict:
+    with config_path.open("rb") as handle:
+        try:
+            # Hand libyaml the mapped bytes directly instead of a decoded stream.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return yaml.load(mapped, Loader=_YamlLoader) or {}
+        except (ValueError, OSError):  # empty file or mmap unsupported
+            handle.seek(0)
+            return yaml.load(handle, Loader=_YamlLoader) or {}
+
+
 def _load_yaml_config() -> dict:
-    if not CONFIG_PATH.exists():
+    """Return a private copy of ``config.yml``, parsed once per file revision."""
+
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
         return {}
-    with CONFIG_PATH.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    return copy.deepcopy(_parse_yaml_config(CONFIG_PATH, mtime_ns))
+
 
+def _discover_plugins(package: str = "plugins") -> tuple[str, ...]:
+    """Return import paths for all plugin packages."""
 
-def _discover_plugins(package: str = "plugins") -> Iterable[str]:
-    """Yield import paths for all plugin packages."""
+    return tuple(record.dotted for record in discover_plugins(package))
 
-    package_path = Path(__file__).resolve().parent.parent / package
-    if not package_path.exists():
-        return []
-    for module_info in pkgutil.iter_modules([str(package_path)]):
-        if module_info.ispkg:
-            yield f"{package}.{module_info.name}"
 
+def _load_manifests(
+    plugins: Iterable[PluginRecord] | None = None,
+    plugin_settings: Mapping[str, Any] | None = None,
+) -> list[dict[str, str]]:
+    """Return plugin manifests sorted by title with config overrides applied."""
 
-def _load_manifests() -> list[dict[str, str]]:
+    if plugins is None:
+        plugins = discover_plugins()
+    plugin_settings = plugin_settings or {}
     manifests: list[dict[str, str]] = []
-    for dotted in _discover_plugins():
-        module = importlib.import_module(dotted)
-        manifest = getattr(module, "manifest", None)
-        if manifest:
-            manifests.append(manifest)
+    for record in plugins:
+        manifest = record.manifest
+        if not manifest:
+            continue
+        blueprint = manifest.get("blueprint")
+        plugin_config = plugin_settings.get(blueprint, {}) if blueprint else {}
+        if plugin_config.get("docs"):
+            manifest["docs"] = plugin_config["docs"]
+        if plugin_config.get("summary"):
+            manifest["summary"] = plugin_config["summary"]
+        manifests.append(manifest)
     manifests.sort(key=lambda item: item["title"].lower())
     return manifests
 
@@ -143,14 +223,16 @@ def create_app(config_name: str | None = None) -> Flask:
         if config_obj:
             app.config.from_object(config_obj)
 
+    plugins = discover_plugins()
     register_plugin_blueprints(app)
     install_request_logging(app)
 
-    manifest_data = _load_vite_manifest()
-    assets = _resolve_assets(manifest_data)
-    app.extensions["react_assets"] = assets
+    app.extensions["react_assets"] = _react_assets()
 
     def _theme_state() -> tuple[dict, str, str]:
+        cached = g.get("_theme_state")
+        if cached is not None:
+            return cached
         site_config = app.config.get("SITE_SETTINGS", {})
         themes = dict(site_config.get("themes", {}) or {})
         if not themes:
@@ -160,12 +242,16 @@ def create_app(config_name: str | None = None) -> Flask:
             default_theme = next(iter(themes.keys()))
         requested = request.args.get("theme")
         current_theme = requested if requested in themes else default_theme
-        return themes, default_theme, current_theme
+        g._theme_state = (themes, default_theme, current_theme)
+        return g._theme_state
 
     def _apply_theme(url: str, theme: str) -> str:
         return _append_theme_param(url, theme, request.host)
 
     def _prepare_manifests(theme: str) -> list[dict]:
+        prepared = g.setdefault("_prepared_manifests", {})
+        if theme in prepared:
+            return prepared[theme]
         manifests: list[dict] = []
         for manifest in app.config.get("PLUGIN_MANIFESTS", []):
             entry = dict(manifest)
@@ -178,6 +264,7 @@ def create_app(config_name: str | None = None) -> Flask:
                 elif blueprint:
                     entry["docs"] = _apply_theme(f"/help/{blueprint}", theme)
             manifests.append(entry)
+        prepared[theme] = manifests
         return manifests
 
     def _render_react_page(status: int = 200):
@@ -213,25 +300,18 @@ def create_app(config_name: str | None = None) -> Flask:
     app.extensions["theme_url"] = _apply_theme
     app.extensions["render_react"] = _render_react_page
 
+    response_headers = tuple(app.config.get("RESPONSE_HEADERS", {}).items())
+
     @app.after_request
     def apply_response_headers(response):
         """Attach strict security headers to every outgoing response."""
 
-        configured = app.config.get("RESPONSE_HEADERS", {})
-        for header, value in configured.items():
-            if header not in response.headers:
-                response.headers[header] = value
+        headers = response.headers
+        for header, value in response_headers:
+            headers.setdefault(header, value)
         return response
 
-    manifests = _load_manifests()
-    for manifest in manifests:
-        blueprint = manifest.get("blueprint")
-        plugin_config = plugin_settings.get(blueprint, {}) if blueprint else {}
-        if plugin_config.get("docs"):
-            manifest["docs"] = plugin_config["docs"]
-        if plugin_config.get("summary"):
-            manifest["summary"] = plugin_config["summary"]
-    app.config["PLUGIN_MANIFESTS"] = manifests
+    app.config["PLUGIN_MANIFESTS"] = _load_manifests(plugins, plugin_settings)
 
     @app.context_processor
     def inject_navigation():
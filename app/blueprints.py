@@ -2,37 +2,29 @@
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
-from pathlib import Path
-from typing import Iterable
-
-from flask import Flask
-
-
-def _iter_blueprints(package: str = "plugins") -> Iterable:
-    module_path = Path(__file__).resolve().parent.parent / package
-    if not module_path.exists():
-        return []
-    blueprints = []
-    for module_info in pkgutil.iter_modules([str(module_path)]):
-        if not module_info.ispkg:
-            continue
-        dotted = f"{package}.{module_info.name}.api"
-        module = importlib.import_module(dotted)
-        module_blueprints = getattr(module, "blueprints", None)
-        if module_blueprints:
-            blueprints.extend(module_blueprints)
-            continue
-        blueprint = getattr(module, "bp", None)
-        if blueprint is not None:
-            blueprints.append(blueprint)
+from flask import Blueprint, Flask
+
+from .plugins_loader import PluginRecord, discover_plugins
+
+_BLUEPRINT_CACHE: dict[str, tuple[tuple[PluginRecord, ...], tuple[Blueprint, ...]]] = {}
+
+
+def get_blueprints(package: str = "plugins") -> tuple[Blueprint, ...]:
+    """Return all plugin blueprints, flattened once per discovery result."""
+
+    plugins = discover_plugins(package)
+    cached = _BLUEPRINT_CACHE.get(package)
+    if cached is not None and cached[0] is plugins:
+        return cached[1]
+    blueprints = tuple(bp for record in plugins for bp in record.blueprints)
+    _BLUEPRINT_CACHE[package] = (plugins, blueprints)
     return blueprints
 
 
-def register_plugin_blueprints(app: Flask) -> None:
-    for bp in _iter_blueprints():
-        app.register_blueprint(bp)
+def register_plugin_blueprints(app: Flask, package: str = "plugins") -> None:
+    register = app.register_blueprint
+    for bp in get_blueprints(package):
+        register(bp)
 
 
-__all__ = ["register_plugin_blueprints"]
+__all__ = ["get_blueprints", "register_plugin_blueprints"]
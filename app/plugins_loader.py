@@ -0,0 +1,86 @@
+"""Single-pass discovery of plugin packages, manifests, and blueprints."""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+from flask import Blueprint
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_PLUGIN_CACHE: dict[str, tuple[int, tuple["PluginRecord", ...]]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class PluginRecord:
+    """Import path, manifest, and blueprints exported by one plugin package."""
+
+    dotted: str
+    manifest: Mapping[str, Any] | None
+    blueprints: tuple[Blueprint, ...]
+
+
+def _import(dotted: str):
+    return sys.modules.get(dotted) or importlib.import_module(dotted)
+
+
+def _import_api(dotted: str):
+    api_name = f"{dotted}.api"
+    try:
+        return _import(api_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != api_name:
+            raise
+        return None
+
+
+def _load_record(dotted: str) -> PluginRecord:
+    module = _import(dotted)
+    api = _import_api(dotted)
+    blueprints: tuple[Blueprint, ...] = ()
+    if api is not None:
+        module_blueprints = getattr(api, "blueprints", None)
+        if module_blueprints:
+            blueprints = tuple(module_blueprints)
+        else:
+            blueprint = getattr(api, "bp", None)
+            if blueprint is not None:
+                blueprints = (blueprint,)
+    return PluginRecord(
+        dotted=dotted,
+        manifest=getattr(module, "manifest", None) or None,
+        blueprints=blueprints,
+    )
+
+
+def discover_plugins(package: str = "plugins") -> tuple[PluginRecord, ...]:
+    """Import every plugin package once and return its record.
+
+    The result is cached per package and invalidated when the package
+    directory's mtime changes, i.e. when a plugin is added or removed.
+    """
+
+    package_path = _REPO_ROOT / package
+    try:
+        mtime_ns = package_path.stat().st_mtime_ns
+    except OSError:
+        return ()
+    cached = _PLUGIN_CACHE.get(package)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    # iter_modules() goes through get_importer(), which reuses the FileFinder
+    # cached in sys.path_importer_cache.
+    records = tuple(
+        _load_record(f"{package}.{info.name}")
+        for info in pkgutil.iter_modules([str(package_path)])
+        if info.ispkg
+    )
+    _PLUGIN_CACHE[package] = (mtime_ns, records)
+    return records
+
+
+__all__ = ["PluginRecord", "discover_plugins"]
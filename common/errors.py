@@ -16,10 +16,17 @@ class AppError(Exception):
     details: Mapping[str, Any] | None = None
 
     def to_dict(self) -> Mapping[str, Any]:
+        """Return the JSON payload; plain-dict ``details`` are shared, not copied."""
+
+        details = self.details
+        if details is None:
+            details = {}
+        elif not isinstance(details, dict):
+            details = dict(details)
         payload: MutableMapping[str, Any] = {
             "code": self.code,
             "message": self.message,
-            "details": dict(self.details or {}),
+            "details": details,
         }
         return payload
 
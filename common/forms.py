@@ -18,6 +18,28 @@ def _lookup(data: FormDataLike, key: str) -> Any:
     return data[key] if isinstance(data, Mapping) and key in data else None
 
 
+def _check_bounds(
+    value: float, label: str, minimum: float | None, maximum: float | None
+) -> None:
+    if minimum is not None and value < minimum:
+        raise ValidationError(f"{label} must be ≥ {minimum}")
+    if maximum is not None and value > maximum:
+        raise ValidationError(f"{label} must be ≤ {maximum}")
+
+
+def _plain_int(raw: Any) -> int | None:
+    """Return *raw* as an int when it is already integral, else ``None``."""
+
+    if isinstance(raw, int):
+        return int(raw)
+    if isinstance(raw, str):
+        text = raw.strip()
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        if digits.isdecimal():
+            return int(text)
+    return None
+
+
 def get_float(
     data: FormDataLike,
     key: str,
@@ -35,7 +57,9 @@ def get_float(
 
     field_label = field_name or key
     raw = _lookup(data, key)
-    if raw is None or (isinstance(raw, str) and raw.strip() == ""):
+    if isinstance(raw, float):
+        value = raw
+    elif raw is None or (isinstance(raw, str) and raw.strip() == ""):
         value = default
     else:
         try:
@@ -43,11 +67,7 @@ def get_float(
         except (TypeError, ValueError) as exc:
             raise ValidationError(f"Invalid value for {field_label}") from exc
 
-    if minimum is not None and value < minimum:
-        raise ValidationError(f"{field_label} must be ≥ {minimum}")
-    if maximum is not None and value > maximum:
-        raise ValidationError(f"{field_label} must be ≤ {maximum}")
-
+    _check_bounds(value, field_label, minimum, maximum)
     return value
 
 
@@ -62,6 +82,19 @@ def get_int(
 ) -> int:
     """Extract an integer from *data* with validation."""
 
+    float_min = float(minimum) if minimum is not None else None
+    float_max = float(maximum) if maximum is not None else None
+    raw = _lookup(data, key)
+    if raw is None or (isinstance(raw, str) and raw.strip() == ""):
+        fast_value = _plain_int(default)
+    else:
+        fast_value = _plain_int(raw)
+    if fast_value is not None:
+        # Integral input needs no float detour or rounding; bounds are checked
+        # exactly as the float stage below would.
+        _check_bounds(fast_value, field_name or key, float_min, float_max)
+        return fast_value
+
     value = int(
         round(
             get_float(
@@ -69,17 +102,13 @@ def get_int(
                 key,
                 float(default),
                 field_name=field_name,
-                minimum=float(minimum) if minimum is not None else None,
-                maximum=float(maximum) if maximum is not None else None,
+                minimum=float_min,
+                maximum=float_max,
             )
         )
     )
 
-    if minimum is not None and value < minimum:
-        raise ValidationError(f"{field_name or key} must be ≥ {minimum}")
-    if maximum is not None and value > maximum:
-        raise ValidationError(f"{field_name or key} must be ≤ {maximum}")
-
+    _check_bounds(value, field_name or key, minimum, maximum)
     return value
 
 
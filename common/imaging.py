@@ -17,8 +17,11 @@ def image_to_bytes(image: Image.Image, format: str = "PNG") -> bytes:
 
 def arrays_to_png(image: np.ndarray) -> Tuple[bytes, bytes]:
     rgb = Image.fromarray(image)
-    mask = rgb.convert("L")
-    return image_to_bytes(rgb), image_to_bytes(mask)
+    if rgb.mode == "L":
+        # A grayscale image is its own mask: encode it once for both.
+        png = image_to_bytes(rgb)
+        return png, png
+    return image_to_bytes(rgb), image_to_bytes(rgb.convert("L"))
 
 
 __all__ = ["image_to_bytes", "arrays_to_png"]
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
+import string
 import tempfile
+import threading
 from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
@@ -14,10 +17,23 @@ from app import config
 
 SAFE_FILENAME_CHARS = {"-", "_", "."}
 
+_SAFE_ASCII = frozenset(string.ascii_letters + string.digits) | SAFE_FILENAME_CHARS
+# Single C-level pass for the common ASCII case: replace (name) or drop (ext).
+_NAME_TABLE = str.maketrans(
+    {chr(i): "_" for i in range(128) if chr(i) not in _SAFE_ASCII}
+)
+_EXT_TABLE = str.maketrans(
+    {chr(i): None for i in range(128) if chr(i) not in _SAFE_ASCII}
+)
+# ``\w`` matches exactly str.isalnum() plus "_" for str patterns.
+_UNSAFE_RE = re.compile(r"[^\w.\-]")
+
 
 class TempDir:
     """Temporary directory rooted in tmpfs that cleans up eagerly."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: Path):
         self.path = path
 
@@ -31,23 +47,45 @@ class TempDir:
         self.cleanup()
 
 
+_TMPFS_READY: Path | None = None
+_TMPFS_LOCK = threading.Lock()
+
+
 def ensure_tmpfs_root() -> Path:
+    global _TMPFS_READY
+
     root = config.BaseConfig.UPLOAD_TMPFS_ROOT
-    root.mkdir(parents=True, exist_ok=True)
+    if _TMPFS_READY == root:
+        return root
+    with _TMPFS_LOCK:
+        if _TMPFS_READY != root:
+            root.mkdir(parents=True, exist_ok=True)
+            _TMPFS_READY = root
     return root
 
 
+def reset_tmpfs_cache() -> None:
+    """Forget that the tmpfs root exists so the next call recreates it."""
+
+    global _TMPFS_READY
+
+    with _TMPFS_LOCK:
+        _TMPFS_READY = None
+
+
 def new_tmpfs_dir(prefix: str = "aio-") -> TempDir:
-    root = ensure_tmpfs_root()
-    path = Path(tempfile.mkdtemp(prefix=prefix, dir=root))
-    return TempDir(path)
+    try:
+        path = tempfile.mkdtemp(prefix=prefix, dir=ensure_tmpfs_root())
+    except FileNotFoundError:
+        # The root was removed after it was cached (tmpfiles cleanup, remount).
+        reset_tmpfs_cache()
+        path = tempfile.mkdtemp(prefix=prefix, dir=ensure_tmpfs_root())
+    return TempDir(Path(path))
 
 
 def buffer_from_bytes(data: bytes) -> BytesIO:
-    buffer = BytesIO()
-    buffer.write(data)
-    buffer.seek(0)
-    return buffer
+    # BytesIO(data) shares the bytes object until the buffer is written to.
+    return BytesIO(data)
 
 
 @contextmanager
@@ -65,10 +103,12 @@ def secure_filename(filename: str, *, fallback: str = "upload") -> str:
     if not filename:
         return fallback
     name, ext = os.path.splitext(filename)
-    safe_name = "".join(
-        ch if ch.isalnum() or ch in SAFE_FILENAME_CHARS else "_" for ch in name
-    )
-    safe_ext = "".join(ch for ch in ext if ch.isalnum() or ch in SAFE_FILENAME_CHARS)
+    if filename.isascii():
+        safe_name = name.translate(_NAME_TABLE)
+        safe_ext = ext.translate(_EXT_TABLE)
+    else:
+        safe_name = _UNSAFE_RE.sub("_", name)
+        safe_ext = _UNSAFE_RE.sub("", ext)
     safe_name = safe_name.strip("._") or fallback
     safe_ext = safe_ext.strip("._")
     return f"{safe_name}{f'.{safe_ext}' if safe_ext else ''}"
@@ -77,6 +117,7 @@ def secure_filename(filename: str, *, fallback: str = "upload") -> str:
 __all__ = [
     "TempDir",
     "ensure_tmpfs_root",
+    "reset_tmpfs_cache",
     "new_tmpfs_dir",
     "buffer_from_bytes",
     "in_memory_file",
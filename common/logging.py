@@ -2,54 +2,151 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
+import secrets
+import threading
 import time
-import uuid
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
 
-from flask import Flask, g, request
+from flask import Flask, g, has_request_context, request
 
 DEFAULT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
 
 
+LOG_QUEUE_SIZE = 10_000
+
+# (enqueueing handler, listener draining its queue) per configured logger.
+_PIPELINES: list[tuple[QueueHandler, QueueListener]] = []
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when full.
+
+    Dropped records are counted; once the queue has room again a warning
+    with the count is enqueued ahead of the next record.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.dropped:
+                self._enqueue_drop_warning(record.name)
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def _enqueue_drop_warning(self, name: str) -> None:
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        if not dropped:
+            return
+        warning = logging.LogRecord(
+            name,
+            logging.WARNING,
+            __file__,
+            0,
+            "dropped %d log records while the log queue was full",
+            (dropped,),
+            None,
+        )
+        try:
+            self.queue.put_nowait(warning)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += dropped
+            raise
+
+
+def _start_listener(
+    log_queue: queue.Queue, *handlers: logging.Handler
+) -> QueueListener:
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _restart_listeners() -> None:  # pragma: no cover - runs in forked workers
+    # Listener threads do not survive fork() and the inherited queue may hold
+    # the parent's records or a lock taken by its listener: start afresh.
+    for index, (queue_handler, listener) in enumerate(_PIPELINES):
+        queue_handler.queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        queue_handler.dropped = 0
+        _PIPELINES[index] = (
+            queue_handler,
+            _start_listener(queue_handler.queue, *listener.handlers),
+        )
+
+
+def _stop_listeners() -> None:
+    for _, listener in _PIPELINES:
+        listener.stop()
+    _PIPELINES.clear()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners)
+
+
 def get_logger(name: str = "ml_server_aio") -> logging.Logger:
+    """Return *name*'s logger, writing to stderr from a background thread.
+
+    Request threads only enqueue records; a :class:`QueueListener` performs the
+    stream I/O so slow terminals or pipes never stall a response.
+    """
+
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
         handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
-        logger.addHandler(handler)
+        queue_handler = _DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        _PIPELINES.append(
+            (queue_handler, _start_listener(queue_handler.queue, handler))
+        )
+        logger.addHandler(queue_handler)
         logger.setLevel(logging.INFO)
     return logger
 
 
-def _request_context() -> dict[str, Any]:
-    return {
-        "request_id": getattr(g, "request_id", "-"),
-        "path": request.path,
-        "method": request.method,
-    }
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the current request's id, path, and method."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if has_request_context():
+            record.request_id = g.get("request_id", "-")
+            record.path = request.path
+            record.method = request.method
+        else:
+            record.request_id = record.path = record.method = "-"
+        return True
 
 
 def install_request_logging(app: Flask) -> None:
     logger = get_logger()
+    if not any(isinstance(f, RequestContextFilter) for f in logger.filters):
+        logger.addFilter(RequestContextFilter())
 
     @app.before_request
     def _begin_request() -> None:  # pragma: no cover - flask hooks
-        g.request_id = uuid.uuid4().hex
-        g.request_started = time.perf_counter()
+        g.request_id = secrets.token_hex(16)
+        g.request_started = time.monotonic_ns()
 
     @app.after_request
     def _after_request(response):  # pragma: no cover - flask hooks
-        duration_ms = 0.0
+        duration_us = 0
         if hasattr(g, "request_started"):
-            duration_ms = (time.perf_counter() - g.request_started) * 1000
+            duration_us = (time.monotonic_ns() - g.request_started) // 1000
         logger.info(
             "handled request",
-            extra={
-                **_request_context(),
-                "status": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            },
+            extra={"status": response.status_code, "duration_ms": duration_us / 1000},
         )
         response.headers.setdefault("X-Request-ID", getattr(g, "request_id", ""))
         return response
@@ -57,7 +154,7 @@ def install_request_logging(app: Flask) -> None:
     @app.teardown_request
     def _teardown_request(exc):  # pragma: no cover - flask hooks
         if exc is not None:
-            logger.exception("request error", extra=_request_context())
+            logger.exception("request error")
 
 
-__all__ = ["get_logger", "install_request_logging"]
+__all__ = ["RequestContextFilter", "get_logger", "install_request_logging"]
@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
 
+@lru_cache(maxsize=32)
+def _resolve_root(root: str, base_dir: Path) -> Path:
+    root_path = Path(root).expanduser()
+    if not root_path.is_absolute():
+        root_path = base_dir / root_path
+    return root_path
+
+
 def resolve_models_root(
     app_config: Mapping[str, object],
     plugin_settings: Mapping[str, object] | None,
     *,
     base_dir: Path,
 ) -> Path:
-    model_store = app_config.get("MODEL_STORE", {}) if isinstance(app_config, Mapping) else {}
+    model_store = (
+        app_config.get("MODEL_STORE", {}) if isinstance(app_config, Mapping) else {}
+    )
     model_store = model_store or {}
     plugin_settings = plugin_settings or {}
 
@@ -29,11 +40,8 @@ def resolve_models_root(
         or model_store.get("root")
         or "model_store"
     )
-
-    root_path = Path(str(root)).expanduser()
-    if not root_path.is_absolute():
-        root_path = base_dir / root_path
-    return root_path
+    # The environment is re-read on every call; only the Path work is cached.
+    return _resolve_root(str(root), base_dir)
 
 
 def resolve_model_path(root: Path, model_file: str) -> Path:
@@ -4,18 +4,47 @@ from __future__ import annotations
 
 from typing import Any, Mapping
 
-from flask import Response, jsonify
+from flask import Response, current_app, jsonify
 
 from .errors import AppError
 
+try:  # Optional C-accelerated JSON encoder
+    import orjson
+
+    _orjson_dumps = orjson.dumps
+    # Dates go through Flask's encoder (HTTP-date strings) as with jsonify.
+    # Unlike jsonify, NaN and infinities encode as null rather than NaN.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    _ORJSON_SORTED = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS
+    ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+
+def _json_response(payload: Mapping[str, Any], status: int) -> Response:
+    if not ORJSON_AVAILABLE:  # pragma: no cover - optional dependency
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+
+    provider = current_app.json
+    body = _orjson_dumps(
+        payload,
+        # Types orjson does not know (Decimal, ...) fall back to Flask's encoder.
+        default=provider.default,
+        option=_ORJSON_SORTED if provider.sort_keys else _ORJSON_OPTIONS,
+    )
+    return current_app.response_class(body, status=status, mimetype=provider.mimetype)
+
 
 def ok(data: Any, *, status: int = 200) -> Response:
     """Return a success envelope."""
 
-    payload = {"success": True, "data": data}
-    response = jsonify(payload)
-    response.status_code = status
-    return response
+    return _json_response({"success": True, "data": data}, status)
 
 
 def fail(error: AppError | Mapping[str, Any], *, status: int | None = None) -> Response:
@@ -23,14 +52,10 @@ def fail(error: AppError | Mapping[str, Any], *, status: int | None = None) -> R
 
     if isinstance(error, AppError):
         payload = {"success": False, "error": error.to_dict()}
-        response = jsonify(payload)
-        response.status_code = status or error.status_code
-        return response
+        return _json_response(payload, status or error.status_code)
 
     payload = {"success": False, "error": dict(error)}
-    response = jsonify(payload)
-    response.status_code = status or 400
-    return response
+    return _json_response(payload, status or 400)
 
 
 __all__ = ["ok", "fail"]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from typing import Any, Iterable, Mapping, TypeVar
 
 import pydantic
@@ -70,6 +72,31 @@ class FileLimit:
         return cls(max_files=max_files, max_size=max_mb * 1024 * 1024)
 
 
+def _memory_buffer(stream: Any) -> Any | None:
+    """Return the BytesIO holding an in-memory upload, if there is one."""
+
+    # SpooledTemporaryFile keeps small uploads in a BytesIO under ``_file``.
+    # That attribute is a CPython detail: anything other than a BytesIO
+    # (a rolled-over spool, a changed stdlib) takes the seek/tell path.
+    buffer = getattr(stream, "_file", stream)
+    return buffer if isinstance(buffer, BytesIO) else None
+
+
+def _stream_size(file: FileStorage) -> int:
+    # ``file.content_length`` comes from client-supplied part headers, so it
+    # is deliberately not trusted here.
+    buffer = _memory_buffer(file.stream)
+    if buffer is not None:
+        with buffer.getbuffer() as view:
+            size = view.nbytes
+    else:
+        file.seek(0, 2)
+        size = file.tell()
+    # Callers rely on the stream being rewound, as it always has been.
+    file.seek(0)
+    return size
+
+
 def enforce_limits(files: Iterable[FileStorage], limit: FileLimit) -> None:
     files = list(files)
     if not files:
@@ -77,13 +104,24 @@ def enforce_limits(files: Iterable[FileStorage], limit: FileLimit) -> None:
     if len(files) > limit.max_files:
         raise ValidationError("Too many files uploaded")
     for file in files:
-        file.seek(0, 2)
-        size = file.tell()
-        file.seek(0)
-        if size > limit.max_size:
+        if _stream_size(file) > limit.max_size:
             raise ValidationError("File exceeds allowed size")
 
 
+def read_with_limit(file: FileStorage, limit: FileLimit) -> bytes:
+    """Read *file* in one pass, rejecting it if it exceeds ``limit.max_size``.
+
+    Reading one byte past the limit sizes the upload from the data itself, so
+    the seek/tell round trip of :func:`enforce_limits` is not needed when the
+    caller wants the bytes anyway.
+    """
+
+    data = file.read(limit.max_size + 1)
+    if len(data) > limit.max_size:
+        raise ValidationError("File exceeds allowed size")
+    return data
+
+
 _SIGNATURES: dict[str, tuple[bytes, ...]] = {
     "application/pdf": (b"%PDF-",),
     "image/png": (b"\x89PNG\r\n\x1a\n",),
@@ -93,36 +131,65 @@ _SIGNATURES: dict[str, tuple[bytes, ...]] = {
 
 
 def _looks_like_csv(sample: bytes) -> bool:
+    # Delimiters and newline are single ASCII bytes under both UTF-8 and
+    # latin-1, so the check can run on the raw bytes without decoding.
+    return b"\n" in sample and (b"," in sample or b";" in sample or b"\t" in sample)
+
+
+_CSV_MIMES = frozenset({"text/csv", "application/vnd.ms-excel"})
+# Every (signature, mime) pair, longest signature first.
+_FLAT_SIGNATURES: tuple[tuple[bytes, str], ...] = tuple(
+    sorted(
+        ((signature, mime) for mime, sigs in _SIGNATURES.items() for signature in sigs),
+        key=lambda item: -len(item[0]),
+    )
+)
+
+
+@lru_cache(maxsize=64)
+def _signature_plan(
+    allowed: frozenset[str],
+) -> tuple[dict[int, tuple[bytes, ...]], bool, bool]:
+    """Return the first-byte prefix index, WebP flag, and CSV flag for *allowed*."""
+
+    index: dict[int, tuple[bytes, ...]] = {}
+    for signature, mime in _FLAT_SIGNATURES:
+        if mime in allowed:
+            index[signature[0]] = index.get(signature[0], ()) + (signature,)
+    return index, "image/webp" in allowed, not _CSV_MIMES.isdisjoint(allowed)
+
+
+def _matches_signature(sample: bytes, allowed: set[str]) -> bool:
     if not sample:
         return False
-    try:
-        text = sample.decode("utf-8")
-    except UnicodeDecodeError:
-        try:
-            text = sample.decode("latin-1")
-        except UnicodeDecodeError:
-            return False
-    return any(delim in text for delim in (",", ";", "\t")) and "\n" in text
+    index, check_webp, check_csv = _signature_plan(frozenset(allowed))
+    candidates = index.get(sample[0])
+    if candidates and sample.startswith(candidates):
+        return True
+    if check_webp and sample[:4] == b"RIFF" and sample[8:12] == b"WEBP":
+        return True
+    return check_csv and _looks_like_csv(sample)
 
 
-def _matches_signature(sample: bytes, allowed: set[str]) -> bool:
-    for mime in allowed:
-        signatures = _SIGNATURES.get(mime)
-        if signatures:
-            if any(sample.startswith(signature) for signature in signatures):
-                return True
-        elif mime == "image/webp":
-            if len(sample) >= 12 and sample[:4] == b"RIFF" and sample[8:12] == b"WEBP":
-                return True
-        elif mime in {"text/csv", "application/vnd.ms-excel"}:
-            if _looks_like_csv(sample):
-                return True
-    return False
+def _peek_head(stream: Any, size: int) -> bytes | None:
+    """Return the first *size* bytes of an in-memory stream without seeking."""
+
+    buffer = _memory_buffer(stream)
+    if buffer is None:
+        return None
+    with buffer.getbuffer() as view:
+        return bytes(view[:size])
 
 
 def validate_mime(files: Iterable[FileStorage], allowed: set[str]) -> None:
     for file in files:
         stream = file.stream
+        sample = _peek_head(stream, 1024)
+        if sample is not None:
+            if not _matches_signature(sample, allowed):
+                raise ValidationError("Unsupported or invalid file signature")
+            continue
+
         try:
             current = stream.tell()
         except (AttributeError, OSError):
@@ -155,5 +222,6 @@ __all__ = [
     "parse_model",
     "FileLimit",
     "enforce_limits",
+    "read_with_limit",
     "validate_mime",
 ]
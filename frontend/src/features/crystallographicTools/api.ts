@@ -118,6 +118,14 @@ export type XrdPattern = {
   summary: { peak_count: number; max_intensity: number };
 };
 
+// The endpoint sends the curve as parallel arrays (columnar_curve) to keep the
+// response small; charts want one object per point, so it is rebuilt here.
+type XrdPatternResponse = Omit<XrdPattern, "curve"> & {
+  curve?: XrdCurvePoint[];
+  curve_two_theta?: number[];
+  curve_intensity?: number[];
+};
+
 export async function xrdPattern(payload: {
   cif: string;
   radiation?: string;
@@ -149,12 +157,25 @@ export async function xrdPattern(payload: {
       w: payload.profile?.w ?? 0.1,
       profile: payload.profile?.profile || "gaussian",
     },
+    columnar_curve: true,
+  };
+  const { curve, curve_two_theta, curve_intensity, ...pattern } = await apiFetch<XrdPatternResponse>(
+    "/api/crystallographic_tools/xrd",
+    {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+    },
+  );
+  return {
+    ...pattern,
+    curve:
+      curve ??
+      (curve_two_theta ?? []).map((two_theta, index) => ({
+        two_theta,
+        intensity: curve_intensity?.[index] ?? 0,
+      })),
   };
-  return apiFetch<XrdPattern>("/api/crystallographic_tools/xrd", {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(body),
-  });
 }
 
 export type SaedSpot = {
@@ -107,7 +107,8 @@ describe("CrystallographicToolsPage", () => {
       if (url.includes("/xrd")) {
         return Promise.resolve(apiResponse({
           peaks: [{ two_theta: 30, intensity: 100, intensity_lp: 50, intensity_normalized: 100, d_spacing: 2.0, hkl: [1, 1, 1] }],
-          curve: [{ two_theta: 30, intensity: 100 }],
+          curve_two_theta: [30],
+          curve_intensity: [100],
           range: { min: 20, max: 80, step: 0.1 },
           instrument: { radiation: "CuKa", wavelength_angstrom: 1.54, geometry: "bragg_brentano", polarization_ratio: 0.5 },
           profile: { u: 0.02, v: 0, w: 0.1, model: "gaussian" },
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, Response, request
+import hashlib
+import importlib
+from functools import lru_cache
+from types import ModuleType
+
+from flask import Blueprint, Response, current_app, request
 from common.errors import ValidationAppError
+from common.forms import get_bool
 from common.responses import fail, ok
-from common.validation import FileLimit, ValidationError, enforce_limits
-
-from ..core import calculations as calc_core
-from ..core import structure as structure_core
-from ..core import viewer as viewer_core
-from ..core import tem as tem_core
-from ..core import xrd as xrd_core
-from ..core.atomic_radii import covalent_radii_map
+from common.validation import FileLimit, ValidationError, read_with_limit
 
 bp = Blueprint(
     "crystallographic_tools",
@@ -23,20 +22,44 @@ bp = Blueprint(
 
 CRYSTAL_FILE_LIMIT = FileLimit(max_files=1, max_size=5 * 1024 * 1024)
 
+# The core modules pull in pymatgen's diffraction stack, which takes seconds
+# to import; each one is loaded the first time a route needs it.
+_CORES: dict[str, ModuleType] = {}
+
 
-def _parse_structure_from_payload(data: dict) -> Response | object:
+def _core(name: str) -> ModuleType:
+    module = _CORES.get(name)
+    if module is None:
+        module = _CORES[name] = importlib.import_module(f"..core.{name}", __package__)
+    return module
+
+
+def _parse_structure_from_payload(data: dict):
     cif_string = data.get("cif")
     if not cif_string:
-        return fail(ValidationAppError(message="CIF content is required", code="crystallography.missing_cif"))
+        raise ValidationAppError(message="CIF content is required", code="crystallography.missing_cif")
     try:
-        return structure_core.parse_cif_bytes(cif_string.encode())
+        return _core("structure").parse_cif_bytes(cif_string.encode())
     except (ValueError, ValidationError) as exc:
-        return fail(ValidationAppError(message=str(exc), code="crystallography.invalid_cif"))
+        raise ValidationAppError(message=str(exc), code="crystallography.invalid_cif") from exc
+
+
+def _payload_options(data=None) -> dict[str, bool]:
+    """Read the ``include_cif`` / ``columnar_sites`` payload flags.
+
+    Flags come from the query string or form, overridden by the JSON body.
+    """
+
+    options = {}
+    for key, default in (("include_cif", True), ("columnar_sites", False)):
+        fallback = get_bool(request.values, key, default=default)
+        options[key] = get_bool(data, key, default=fallback)
+    return options
 
 
 def _parse_supercell(raw) -> tuple[int, int, int] | None:
     try:
-        return viewer_core.parse_supercell_param(raw)
+        return _core("viewer").parse_supercell_param(raw)
     except ValidationError as exc:
         raise ValidationAppError(message=str(exc), code="crystallography.invalid_supercell", details=getattr(exc, "details", None))
 
@@ -46,11 +69,12 @@ def crystal_viewer_parse() -> Response:
     file = request.files.get("file")
     if not file:
         return fail(ValidationAppError(message="Structure file is required", code="crystallography.missing_file"))
+    viewer_core = _core("viewer")
     try:
-        enforce_limits([file], CRYSTAL_FILE_LIMIT)
+        data = read_with_limit(file, CRYSTAL_FILE_LIMIT)
         supercell = _parse_supercell(request.form.get("supercell"))
-        structure = viewer_core.parse_structure_bytes(file.read(), filename=file.filename)
-        payload = viewer_core.structure_to_viewer_payload(structure, supercell=supercell)
+        structure = viewer_core.parse_structure_bytes(data, filename=file.filename)
+        payload = viewer_core.structure_to_viewer_payload(structure, supercell=supercell, **_payload_options())
     except ValidationAppError as exc:
         return fail(exc)
     except ValidationError as exc:
@@ -64,9 +88,23 @@ def crystal_viewer_parse() -> Response:
     return ok(payload)
 
 
+@lru_cache(maxsize=1)
+def _element_radii_body() -> tuple[bytes, str]:
+    body = ok(_core("atomic_radii").covalent_radii_map()).get_data()
+    return body, hashlib.sha256(body).hexdigest()
+
+
 @bp.get("/crystal_viewer/element_radii")
 def crystal_viewer_element_radii() -> Response:
-    return ok(covalent_radii_map())
+    # The radii table is constant per deploy, so its envelope is serialized
+    # once. The URL is not versioned: clients revalidate with If-None-Match
+    # on every use and get a 304 until a redeploy changes the table.
+    body, etag = _element_radii_body()
+    response = current_app.response_class(body, mimetype=current_app.json.mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 @bp.post("/crystal_viewer/export_structure")
@@ -76,10 +114,11 @@ def crystal_viewer_export_structure() -> Response:
     if not cif_string:
         return fail(ValidationAppError(message="CIF or POSCAR content is required", code="crystallography.missing_cif"))
     supercell = None
+    viewer_core = _core("viewer")
     try:
         supercell = _parse_supercell(data.get("supercell"))
         structure = viewer_core.parse_structure_bytes(cif_string.encode(), filename=data.get("filename"))
-        payload = viewer_core.structure_to_viewer_payload(structure, supercell=supercell)
+        payload = viewer_core.structure_to_viewer_payload(structure, supercell=supercell, **_payload_options(data))
     except ValidationAppError as exc:
         return fail(exc)
     except ValidationError as exc:
@@ -98,10 +137,11 @@ def load_cif() -> Response:
     file = request.files.get("file")
     if not file:
         return fail(ValidationAppError(message="CIF file is required", code="crystallography.missing_file"))
+    viewer_core = _core("viewer")
     try:
-        enforce_limits([file], CRYSTAL_FILE_LIMIT)
-        structure = viewer_core.parse_structure_bytes(file.read(), filename=file.filename)
-        payload = viewer_core.structure_to_viewer_payload(structure)
+        data = read_with_limit(file, CRYSTAL_FILE_LIMIT)
+        structure = viewer_core.parse_structure_bytes(data, filename=file.filename)
+        payload = viewer_core.structure_to_viewer_payload(structure, **_payload_options())
     except (ValueError, ValidationError) as exc:
         return fail(ValidationAppError(message=str(exc), code="crystallography.invalid_cif"))
 
@@ -117,15 +157,20 @@ def edit_cif() -> Response:
     lattice = data.get("lattice") or {}
     sites = data.get("sites") or []
     supercell = data.get("supercell") or [1, 1, 1]
+    viewer_core = _core("viewer")
     try:
         structure = viewer_core.parse_structure_bytes(cif_string.encode(), filename=data.get("filename"))
-        updated = structure_core.edit_structure(
+        updated = _core("structure").edit_structure(
             structure,
             lattice_params=lattice or None,
             sites=sites or None,
             supercell=supercell,
         )
-        payload = viewer_core.structure_to_viewer_payload(updated, supercell=viewer_core.parse_supercell_param(supercell))
+        payload = viewer_core.structure_to_viewer_payload(
+            updated,
+            supercell=viewer_core.parse_supercell_param(supercell),
+            **_payload_options(data),
+        )
     except (ValueError, ValidationError) as exc:
         return fail(ValidationAppError(message=str(exc), code="crystallography.edit_error"))
     return ok(payload)
@@ -134,11 +179,9 @@ def edit_cif() -> Response:
 @bp.post("/xrd")
 def xrd() -> Response:
     data = request.get_json(silent=True) or {}
-    structure = _parse_structure_from_payload(data)
-    if isinstance(structure, Response):
-        return structure
-
+    xrd_core = _core("xrd")
     try:
+        structure = _parse_structure_from_payload(data)
         instrument = xrd_core.XrdInstrumentConfig.from_payload(data.get("instrument") or {"radiation": data.get("radiation")})
         range_config = xrd_core.XrdRangeConfig.from_payload(data.get("two_theta"))
         profile_config = xrd_core.PeakProfile.from_payload(data.get("profile"))
@@ -147,7 +190,10 @@ def xrd() -> Response:
             instrument_config=instrument,
             range_config=range_config,
             profile_config=profile_config,
+            columnar_curve=get_bool(data, "columnar_curve", default=False),
         )
+    except ValidationAppError as exc:
+        return fail(exc)
     except Exception as exc:  # pragma: no cover - defensive
         return fail(ValidationAppError(message="XRD calculation failed", code="crystallography.xrd_error", details={"error": str(exc)}))
 
@@ -157,15 +203,15 @@ def xrd() -> Response:
 @bp.post("/tem_saed")
 def tem_saed() -> Response:
     data = request.get_json(silent=True) or {}
-    structure = _parse_structure_from_payload(data)
-    if isinstance(structure, Response):
-        return structure
-
+    tem_core = _core("tem")
     try:
+        structure = _parse_structure_from_payload(data)
         pattern = tem_core.compute_saed_pattern(
             structure,
             config=tem_core.SaedConfig.from_payload(structure, data),
         )
+    except ValidationAppError as exc:
+        return fail(exc)
     except (ValidationError, ValueError) as exc:
         return fail(ValidationAppError(message=str(exc), code="crystallography.tem_invalid"))
     except Exception as exc:  # pragma: no cover - defensive
@@ -183,9 +229,6 @@ def tem_saed() -> Response:
 @bp.post("/calculator")
 def calculator() -> Response:
     data = request.get_json(silent=True) or {}
-    structure = _parse_structure_from_payload(data)
-    if isinstance(structure, Response):
-        return structure
 
     def _extract_vector(key: str):
         raw = data.get(key)
@@ -198,12 +241,13 @@ def calculator() -> Response:
         return [float(v) for v in raw]
 
     try:
+        structure = _parse_structure_from_payload(data)
         dir_a = _extract_vector("direction_a")
         dir_b = _extract_vector("direction_b")
         plane = _extract_vector("plane")
         include_equivalents = bool(data.get("include_equivalents", True))
         plane_b = _extract_vector("plane_b")
-        result = calc_core.run_calculations(
+        result = _core("calculations").run_calculations(
             structure,
             direction_a=dir_a,
             direction_b=dir_b,
@@ -211,6 +255,8 @@ def calculator() -> Response:
             plane_b=plane_b,
             include_equivalents=include_equivalents,
         )
+    except ValidationAppError as exc:
+        return fail(exc)
     except (ValidationError, ValueError) as exc:
         return fail(ValidationAppError(message=str(exc), code="crystallography.calc_invalid"))
     except Exception as exc:  # pragma: no cover - defensive
@@ -8,28 +8,37 @@ from typing import Sequence, Tuple
 import numpy as np
 from common.validation import ValidationError
 from pymatgen.core import Lattice, Structure
-from pymatgen.core.operations import SymmOp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
+from .structure import DigestLRUCache, structure_digest
+
+
+ROTATION_CACHE_SIZE = 64
+# Structure content digest -> read-only (N, 3, 3) rotations.
+_ROTATION_CACHE: DigestLRUCache[np.ndarray] = DigestLRUCache(ROTATION_CACHE_SIZE)
+
 
 def _ensure_vector(vec: Sequence[float], *, expected_len: int | None = None) -> np.ndarray:
-    arr = np.array(vec, dtype=float)
-    if expected_len and len(arr) != expected_len:
-        raise ValidationError(f"Expected {expected_len} components, got {len(arr)}")
-    if np.allclose(arr, 0):
+    values = [float(v) for v in vec]
+    if expected_len and len(values) != expected_len:
+        raise ValidationError(f"Expected {expected_len} components, got {len(values)}")
+    # Same tolerance as np.allclose(arr, 0), checked before any array is built.
+    if all(abs(v) <= 1e-8 for v in values):
         raise ValidationError("Vector cannot be all zeros")
-    return arr
+    return np.array(values)
 
 
 def _normalize_three_index(values: Sequence[float]) -> list[float]:
     """Reduce a Miller-like vector to the smallest integer ratio when possible."""
 
-    vec = np.array(values, dtype=float)
-    if np.allclose(vec, 0):
+    # Plain-float arithmetic on the few components; the tolerances mirror
+    # np.allclose's defaults (atol=1e-8 for zero, rtol=1e-5 for rounding).
+    vec = [float(x) for x in values]
+    if all(abs(x) <= 1e-8 for x in vec):
         raise ValidationError("Vector cannot be all zeros")
 
     rounded = [round(x) for x in vec]
-    if np.allclose(vec, rounded, atol=1e-6):
+    if all(abs(x - r) <= 1e-6 + 1e-5 * abs(r) for x, r in zip(vec, rounded, strict=True)):
         ints = [int(x) for x in rounded]
         non_zero = [abs(x) for x in ints if x != 0]
         if non_zero:
@@ -37,7 +46,7 @@ def _normalize_three_index(values: Sequence[float]) -> list[float]:
             ints = [int(x / gcd) for x in ints]
         return ints
 
-    return [float(x) for x in vec]
+    return vec
 
 
 def is_hexagonal_lattice(lattice: Lattice) -> bool:
@@ -104,64 +113,140 @@ def plane_three_to_four(plane: Sequence[float]) -> list[float]:
     return [float(h), float(k), float(i), float(L)]
 
 
-def _cart_direction(lattice: Lattice, direction: Sequence[float]) -> np.ndarray:
-    vec = _ensure_vector(direction)
-    cart = lattice.get_cartesian_coords(vec)
-    return np.array(cart, dtype=float)
+def _four_index_batch(vecs: Sequence[Sequence[float]]) -> np.ndarray:
+    """Apply the three- to four-index transform to every row of *vecs* at once.
 
+    Directions and planes share the same arithmetic, evaluated column-wise in
+    the same order as the scalar helpers so results are bit-identical.
+    """
 
-def _cart_plane_normal(lattice: Lattice, plane: Sequence[float]) -> np.ndarray:
-    normal = lattice.reciprocal_lattice.get_cartesian_coords(plane)
-    return np.array(normal, dtype=float)
+    arr = np.array(vecs, dtype=float).reshape(-1, 3)
+    if (np.abs(arr) <= 1e-8).all(axis=1).any():
+        raise ValidationError("Vector cannot be all zeros")
+    first, second, last = arr.T
+    out = np.empty((len(arr), 4))
+    out[:, 0] = (2 * first - second) / 3
+    out[:, 1] = (2 * second - first) / 3
+    out[:, 2] = -(out[:, 0] + out[:, 1])
+    out[:, 3] = last
+    return out
 
 
-def angle_between_directions(lattice: Lattice, dir_a: Sequence[float], dir_b: Sequence[float]) -> float:
-    """Return the angle (deg) between two directions."""
+def directions_three_to_four_batch(directions: Sequence[Sequence[float]]) -> np.ndarray:
+    """Vectorized :func:`direction_three_to_four` returning an ``(N, 4)`` array."""
+
+    return _four_index_batch(directions)
+
+
+def planes_three_to_four_batch(planes: Sequence[Sequence[float]]) -> np.ndarray:
+    """Vectorized :func:`plane_three_to_four` returning an ``(N, 4)`` array."""
+
+    return _four_index_batch(planes)
+
+
+def _reciprocal_matrix(lattice: Lattice) -> np.ndarray:
+    # Lattice.reciprocal_lattice's arithmetic, minus building a Lattice object.
+    return np.linalg.inv(lattice.matrix).T * 2 * np.pi
 
-    a = _cart_direction(lattice, dir_a)
-    b = _cart_direction(lattice, dir_b)
-    cos_theta = float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+def _cart_direction(matrix: np.ndarray, direction: Sequence[float]) -> np.ndarray:
+    """Cartesian direction for the direct lattice *matrix*."""
+
+    return np.dot(_ensure_vector(direction), matrix)
+
+
+def _cart_plane_normal(reciprocal_matrix: np.ndarray, plane: Sequence[float]) -> np.ndarray:
+    """Cartesian plane normal for the reciprocal lattice matrix."""
+
+    return np.dot(plane, reciprocal_matrix).astype(float, copy=False)
+
+
+def _angle_deg(a: np.ndarray, b: np.ndarray) -> float:
+    """Angle (deg) between two 3-vectors using scalar float arithmetic."""
+
+    ax, ay, az = a.tolist()
+    bx, by, bz = b.tolist()
+    norms = math.sqrt((ax * ax + ay * ay + az * az) * (bx * bx + by * by + bz * bz))
+    # A zero-length vector yields NaN, which the clamp maps to 180 degrees.
+    cos_theta = (ax * bx + ay * by + az * bz) / norms if norms else math.nan
     cos_theta = min(1.0, max(-1.0, cos_theta))
     return math.degrees(math.acos(cos_theta))
 
 
+def angle_between_directions(lattice: Lattice, dir_a: Sequence[float], dir_b: Sequence[float]) -> float:
+    """Return the angle (deg) between two directions."""
+
+    matrix = lattice.matrix
+    return _angle_deg(_cart_direction(matrix, dir_a), _cart_direction(matrix, dir_b))
+
+
 def plane_vector_angle(lattice: Lattice, plane: Sequence[float], direction: Sequence[float]) -> float:
     """Return the angle (deg) between a plane normal and a direction."""
 
-    n = _cart_plane_normal(lattice, plane)
-    d = _cart_direction(lattice, direction)
-    cos_theta = float(np.dot(n, d) / (np.linalg.norm(n) * np.linalg.norm(d)))
-    cos_theta = min(1.0, max(-1.0, cos_theta))
-    return math.degrees(math.acos(cos_theta))
+    return _angle_deg(
+        _cart_plane_normal(_reciprocal_matrix(lattice), plane),
+        _cart_direction(lattice.matrix, direction),
+    )
 
 
 def plane_plane_angle(lattice: Lattice, plane_a: Sequence[float], plane_b: Sequence[float]) -> float:
     """Return the angle (deg) between two planes via their normals."""
 
-    n_a = _cart_plane_normal(lattice, plane_a)
-    n_b = _cart_plane_normal(lattice, plane_b)
-    cos_theta = float(np.dot(n_a, n_b) / (np.linalg.norm(n_a) * np.linalg.norm(n_b)))
-    cos_theta = min(1.0, max(-1.0, cos_theta))
-    return math.degrees(math.acos(cos_theta))
+    reciprocal = _reciprocal_matrix(lattice)
+    return _angle_deg(_cart_plane_normal(reciprocal, plane_a), _cart_plane_normal(reciprocal, plane_b))
 
 
-def symmetry_equivalents(structure: Structure, miller: Sequence[float], *, kind: str) -> list[list[float]]:
-    """Return symmetry-equivalent directions or planes using space group ops."""
+def symmetry_rotations(structure: Structure) -> np.ndarray:
+    """Return the space group's rotation matrices stacked as an ``(N, 3, 3)`` array.
 
-    base = direction_four_to_three if kind == "direction" else plane_four_to_three
-    primary = np.array(base(miller), dtype=float)
+    spglib dominates calculator requests, so results are cached by structure
+    content; the returned array is shared and read-only.
+    """
+
+    return _ROTATION_CACHE.get_or_compute(
+        structure_digest(structure), lambda: _read_only_rotations(structure)
+    )
+
+
+def _read_only_rotations(structure: Structure) -> np.ndarray:
+    rotations = _analyze_rotations(structure)
+    rotations.setflags(write=False)
+    return rotations
+
+
+def _analyze_rotations(structure: Structure) -> np.ndarray:
     try:
         analyzer = SpacegroupAnalyzer(structure, symprec=1e-3, angle_tolerance=0.5)
         operations = analyzer.get_symmetry_operations(cartesian=False)
     except Exception:
-        operations = [SymmOp.from_rotation_and_translation(np.eye(3), [0, 0, 0])]
+        return np.eye(3)[np.newaxis]
+    if not operations:
+        return np.empty((0, 3, 3))
+    return np.stack([op.rotation_matrix for op in operations])
 
-    equivalents: set[Tuple[float, float, float]] = set()
-    for op in operations:
-        rotated = op.rotation_matrix @ primary
-        equivalents.add(tuple(_normalize_three_index(rotated)))
-        equivalents.add(tuple(_normalize_three_index(-rotated)))
 
+def symmetry_equivalents(
+    structure: Structure,
+    miller: Sequence[float],
+    *,
+    kind: str,
+    rotations: np.ndarray | None = None,
+) -> list[list[float]]:
+    """Return symmetry-equivalent directions or planes using space group ops.
+
+    Pass *rotations* from :func:`symmetry_rotations` to reuse one symmetry
+    analysis across several vectors of the same structure.
+    """
+
+    base = direction_four_to_three if kind == "direction" else plane_four_to_three
+    primary = np.array(base(miller), dtype=float)
+    if rotations is None:
+        rotations = symmetry_rotations(structure)
+
+    rotated = rotations @ primary
+    equivalents: set[Tuple[float, float, float]] = {
+        tuple(_normalize_three_index(row)) for row in np.concatenate((rotated, -rotated)).tolist()
+    }
     return [list(vec) for vec in sorted(equivalents)]
 
 
@@ -191,17 +276,24 @@ def run_calculations(
     )
 
     equivalents: dict[str, dict[str, list[list[float]]]] = {"direction": {"three_index": []}, "plane": {"three_index": []}}
-    if include_equivalents:
+    if include_equivalents and (dir_a is not None or plane_vals is not None):
+        rotations = symmetry_rotations(structure)
         if dir_a is not None:
-            equivalents["direction"]["three_index"] = symmetry_equivalents(structure, dir_a, kind="direction")
+            equivalents["direction"]["three_index"] = symmetry_equivalents(
+                structure, dir_a, kind="direction", rotations=rotations
+            )
         if plane_vals is not None:
-            equivalents["plane"]["three_index"] = symmetry_equivalents(structure, plane_vals, kind="plane")
+            equivalents["plane"]["three_index"] = symmetry_equivalents(
+                structure, plane_vals, kind="plane", rotations=rotations
+            )
 
     if hex_lattice:
         if dir_a is not None:
-            equivalents["direction"]["four_index"] = [direction_three_to_four(vec) for vec in equivalents["direction"]["three_index"]]
+            equivalents["direction"]["four_index"] = directions_three_to_four_batch(
+                equivalents["direction"]["three_index"]
+            ).tolist()
         if plane_vals is not None:
-            equivalents["plane"]["four_index"] = [plane_three_to_four(vec) for vec in equivalents["plane"]["three_index"]]
+            equivalents["plane"]["four_index"] = planes_three_to_four_batch(equivalents["plane"]["three_index"]).tolist()
     else:
         equivalents["direction"]["four_index"] = []
         equivalents["plane"]["four_index"] = []
@@ -238,9 +330,12 @@ __all__ = [
     "plane_plane_angle",
     "direction_four_to_three",
     "direction_three_to_four",
+    "directions_three_to_four_batch",
     "plane_four_to_three",
     "plane_three_to_four",
+    "planes_three_to_four_batch",
     "symmetry_equivalents",
+    "symmetry_rotations",
     "run_calculations",
     "is_hexagonal_lattice",
 ]
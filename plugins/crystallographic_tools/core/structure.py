@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Sequence
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterable, Mapping, Sequence, TypeVar
 
+import numpy as np
 from common.validation import ValidationError
 from pymatgen.core import Lattice, Structure
 from pymatgen.io.cif import CifParser
@@ -11,6 +15,45 @@ from pymatgen.io.cif import CifParser
 _ANGLE_TOL = 1e-2
 _LENGTH_TOL = 1e-2
 
+_V = TypeVar("_V")
+
+
+class DigestLRUCache(Generic[_V]):
+    """Thread-safe least-recently-used cache keyed by content digests.
+
+    Values are computed outside the lock, so concurrent misses on one key may
+    both compute it; either result is valid and the last one is kept.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], _V]) -> _V:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+
+STRUCTURE_CACHE_SIZE = 64
+# BLAKE2b digest of the CIF bytes -> parsed structure.
+_STRUCTURE_CACHE: DigestLRUCache[Structure] = DigestLRUCache(STRUCTURE_CACHE_SIZE)
+
+CIF_TEXT_CACHE_SIZE = 64
+# structure_digest() -> CIF text written for that structure.
+_CIF_TEXT_CACHE: DigestLRUCache[str] = DigestLRUCache(CIF_TEXT_CACHE_SIZE)
+
 
 def _is_close(val: float, target: float, tol: float) -> bool:
     return abs(val - target) <= tol
@@ -41,10 +84,19 @@ def _infer_crystal_system(lattice: Lattice) -> str:
 
 
 def parse_cif_bytes(data: bytes) -> Structure:
-    """Parse CIF bytes into a pymatgen Structure."""
+    """Parse CIF bytes into a pymatgen Structure.
+
+    Parsed structures are cached by content hash, since interactive clients
+    send the same CIF to every endpoint; callers receive their own copy.
+    """
     if not data:
         raise ValidationError("Empty CIF payload")
 
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    return _STRUCTURE_CACHE.get_or_compute(key, lambda: _parse_cif_text(data)).copy()
+
+
+def _parse_cif_text(data: bytes) -> Structure:
     cif_text = data.decode(errors="ignore").strip()
     if not cif_text:
         raise ValidationError("Empty CIF payload")
@@ -65,8 +117,74 @@ def parse_cif_bytes(data: bytes) -> Structure:
     raise ValidationError("Unable to parse CIF") from last_error
 
 
-def structure_to_payload(structure: Structure) -> dict:
-    """Return a JSON-serialisable payload describing the structure."""
+def structure_digest(structure: Structure) -> bytes:
+    """Return a 16-byte BLAKE2b digest of everything the CIF writer reads.
+
+    That is the lattice, fractional coordinates, species, site labels, and
+    magnetic moments (which change how sites are labelled).
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(structure.lattice.matrix, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(structure.frac_coords, dtype=float).tobytes())
+    digest.update(
+        "\0".join(
+            f"{site.species_string}\1{site.label}\1{site.properties.get('magmom')!r}" for site in structure
+        ).encode()
+    )
+    return digest.digest()
+
+
+def structure_to_cif(structure: Structure, *, digest: bytes | None = None) -> str:
+    """Serialize *structure* to CIF text, reusing the text for identical content.
+
+    The CIF writer is linear in the site count and the same structure is
+    typically echoed by several endpoints (load, export, edit round-trips).
+    Pass *digest* when the caller already has :func:`structure_digest`.
+    """
+
+    key = digest if digest is not None else structure_digest(structure)
+    return _CIF_TEXT_CACHE.get_or_compute(key, lambda: structure.to(fmt="cif"))
+
+
+def _site_species(structure: Structure) -> list[str]:
+    """Species label of every site, as ``str(site.specie)``.
+
+    ``Structure.species`` re-checks ordering through several pymatgen
+    properties per site; supercell sites share Composition objects, so each
+    distinct one is checked and labelled once (ids are stable while the
+    structure holds its sites).
+    """
+
+    labels: dict[int, str] = {}
+    species: list[str] = []
+    for site in structure:
+        composition = site.species
+        label = labels.get(id(composition))
+        if label is None:
+            if not site.is_ordered:
+                # Let pymatgen raise its usual error for disordered sites.
+                return [str(specie) for specie in structure.species]
+            label = labels[id(composition)] = str(next(iter(composition)))
+        species.append(label)
+    return species
+
+
+def structure_to_payload(
+    structure: Structure,
+    *,
+    include_cif: bool = True,
+    columnar_sites: bool = False,
+    digest: bytes | None = None,
+) -> dict:
+    """Return a JSON-serialisable payload describing the structure.
+
+    Writing the CIF text is linear in the site count; callers that do not
+    need it can pass ``include_cif=False`` to leave ``cif`` as ``None``.
+    With ``columnar_sites=True`` the per-site dicts in ``sites`` are replaced
+    by parallel ``sites_species`` / ``sites_frac_coords`` lists, which are
+    cheaper to build and serialize for large structures.
+    """
 
     lattice = structure.lattice
     is_hexagonal = (
@@ -75,13 +193,18 @@ def structure_to_payload(structure: Structure) -> dict:
         and _is_close(lattice.beta, 90.0, _ANGLE_TOL)
         and _is_close(lattice.gamma, 120.0, _ANGLE_TOL)
     )
-    sites = [
-        {
-            "species": str(site.specie),
-            "frac_coords": list(map(float, site.frac_coords)),
+    # Bulk-extract coordinates as one array instead of touching every Site.
+    frac_coords = structure.frac_coords.tolist()
+    species = _site_species(structure)
+    if columnar_sites:
+        site_fields: dict = {"sites_species": species, "sites_frac_coords": frac_coords}
+    else:
+        site_fields = {
+            "sites": [
+                {"species": specie, "frac_coords": coords}
+                for specie, coords in zip(species, frac_coords, strict=True)
+            ]
         }
-        for site in structure.sites
-    ]
     return {
         "lattice": {
             "a": lattice.a,
@@ -91,9 +214,9 @@ def structure_to_payload(structure: Structure) -> dict:
             "beta": lattice.beta,
             "gamma": lattice.gamma,
         },
-        "sites": sites,
-        "cif": structure.to(fmt="cif"),
-        "num_sites": len(structure.sites),
+        **site_fields,
+        "cif": structure_to_cif(structure, digest=digest) if include_cif else None,
+        "num_sites": len(frac_coords),
         "formula": structure.formula,
         "is_hexagonal": is_hexagonal,
         "crystal_system": _infer_crystal_system(lattice),
@@ -108,52 +231,54 @@ def edit_structure(
 ) -> Structure:
     """Apply lattice/site edits and optional supercell replication."""
 
-    updated = structure.copy()
-
     if lattice_params:
         try:
-            a = float(lattice_params.get("a", updated.lattice.a))
-            b = float(lattice_params.get("b", updated.lattice.b))
-            c = float(lattice_params.get("c", updated.lattice.c))
-            alpha = float(lattice_params.get("alpha", updated.lattice.alpha))
-            beta = float(lattice_params.get("beta", updated.lattice.beta))
-            gamma = float(lattice_params.get("gamma", updated.lattice.gamma))
+            a = float(lattice_params.get("a", structure.lattice.a))
+            b = float(lattice_params.get("b", structure.lattice.b))
+            c = float(lattice_params.get("c", structure.lattice.c))
+            alpha = float(lattice_params.get("alpha", structure.lattice.alpha))
+            beta = float(lattice_params.get("beta", structure.lattice.beta))
+            gamma = float(lattice_params.get("gamma", structure.lattice.gamma))
         except (TypeError, ValueError) as exc:
             raise ValidationError("Invalid lattice parameters") from exc
         if min(a, b, c) <= 0:
             raise ValidationError("Lattice lengths must be positive")
         new_lattice = Lattice.from_parameters(a, b, c, alpha, beta, gamma)
     else:
-        new_lattice = updated.lattice
+        new_lattice = structure.lattice
 
     if sites:
-        if len(sites) != len(updated):
+        if len(sites) != len(structure):
             raise ValidationError("Site count mismatch for edit")
-        new_species: list[str] = []
-        new_coords: list[list[float]] = []
-        for idx, site in enumerate(sites):
-            species = site.get("species", str(updated[idx].specie))
-            coords = site.get("frac_coords", updated[idx].frac_coords)
-            try:
-                coords = [float(x) for x in coords]
-            except (TypeError, ValueError) as exc:
-                raise ValidationError("Invalid fractional coordinates") from exc
-            new_species.append(species)
-            new_coords.append(coords)
-        updated = Structure(
-            updated.lattice,
-            new_species,
-            new_coords,
-            site_properties=dict(updated.site_properties),
-        )
+        new_species: list[object] = [
+            site.get("species", str(structure[idx].specie)) for idx, site in enumerate(sites)
+        ]
+        # One C-level conversion for every coordinate; numpy turns None into
+        # NaN, so non-finite values are rejected alongside non-numeric ones.
+        try:
+            new_coords = np.asarray(
+                [site.get("frac_coords", structure[idx].frac_coords) for idx, site in enumerate(sites)],
+                dtype=float,
+            )
+        except (TypeError, ValueError) as exc:
+            raise ValidationError("Invalid fractional coordinates") from exc
+        if new_coords.shape != (len(sites), 3) or not np.isfinite(new_coords).all():
+            raise ValidationError("Invalid fractional coordinates")
+    else:
+        new_species = [site.specie for site in structure]
+        new_coords = structure.frac_coords
 
-    if lattice_params:
+    # Build the edited structure once, with the final lattice, species, and
+    # coordinates, rather than once per kind of edit.
+    if lattice_params or sites:
         updated = Structure(
             new_lattice,
-            [site.specie for site in updated],
-            [site.frac_coords for site in updated],
-            site_properties=dict(updated.site_properties),
+            new_species,
+            new_coords,
+            site_properties=dict(structure.site_properties),
         )
+    else:
+        updated = structure
 
     if supercell:
         try:
@@ -164,7 +289,14 @@ def edit_structure(
             raise ValidationError("Supercell multipliers must be positive integers")
         updated = updated * scell
 
-    return updated
+    return updated.copy() if updated is structure else updated
 
 
-__all__ = ["parse_cif_bytes", "structure_to_payload", "edit_structure"]
+__all__ = [
+    "DigestLRUCache",
+    "parse_cif_bytes",
+    "structure_digest",
+    "structure_to_cif",
+    "structure_to_payload",
+    "edit_structure",
+]
@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 import math
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Iterable, Mapping, Sequence
 
 import numpy as np
 from common.validation import ValidationError
 from pymatgen.analysis.diffraction.tem import TEMCalculator
 from pymatgen.core import Structure
-from math import gcd
 from .calculations import (
     direction_four_to_three,
     direction_three_to_four,
     is_hexagonal_lattice,
     plane_four_to_three,
     plane_three_to_four,
+    planes_three_to_four_batch,
 )
 
 
@@ -34,7 +34,7 @@ def _coerce_axis(axis: Sequence[float], label: str, *, converter=None) -> tuple[
     return values
 
 
-@dataclass
+@dataclass(slots=True)
 class SaedConfig:
     structure: Structure
     zone_axis: tuple[int, int, int]
@@ -62,9 +62,15 @@ class SaedConfig:
 
         try:
             voltage_kv = float(payload.get("voltage_kv", 200.0))
-            camera_length_cm = float(payload.get("camera_length_cm", payload.get("camera_length_mm", 160.0) / 10))
-            inplane_rotation_deg = float(payload.get("inplane_rotation_deg", payload.get("rotation_deg", 0.0)))
-            min_d_angstrom_raw = payload.get("min_d_angstrom", None)
+            camera_length_cm = payload.get("camera_length_cm")
+            if camera_length_cm is None:
+                camera_length_cm = payload.get("camera_length_mm", 160.0) / 10
+            camera_length_cm = float(camera_length_cm)
+            inplane_rotation_deg = payload.get("inplane_rotation_deg")
+            if inplane_rotation_deg is None:
+                inplane_rotation_deg = payload.get("rotation_deg", 0.0)
+            inplane_rotation_deg = float(inplane_rotation_deg)
+            min_d_angstrom_raw = payload.get("min_d_angstrom")
             min_d_angstrom = float(min_d_angstrom_raw) if min_d_angstrom_raw is not None else 0.5
             max_index = int(payload.get("max_index", 8))
             laue_zone = int(payload.get("laue_zone", 0))
@@ -92,7 +98,9 @@ class SaedConfig:
             except (TypeError, ValueError):
                 pass
 
-        phase_name = payload.get("phase_name") if isinstance(payload.get("phase_name"), str) else None
+        phase_name = payload.get("phase_name")
+        if not isinstance(phase_name, str):
+            phase_name = None
 
         return cls(
             structure=structure,
@@ -111,7 +119,7 @@ class SaedConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SaedSpot:
     hkl: tuple[int, int, int]
     zone: int
@@ -130,6 +138,11 @@ class SaedSpot:
     label: str
     hkil: tuple[int, int, int, int] | None = None
 
+    def to_dict(self) -> dict:
+        # Fields are scalars and int tuples, so reading them in slot (field)
+        # order matches dataclasses.asdict() without its recursive deep copy.
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 def _rotation_angle_for_x_axis(
     positions: Mapping[tuple[int, int, int], np.ndarray],
@@ -144,41 +157,75 @@ def _rotation_angle_for_x_axis(
     return -math.degrees(math.atan2(y_val, x_val))
 
 
-def _normalize_four_index(values: Sequence[float]) -> tuple[int, int, int, int]:
-    """Return normalized Miller–Bravais indices using smallest integers."""
+def _planes_three_to_four_normalized(hkls: Sequence[Sequence[int]]) -> list[tuple[int, int, int, int]]:
+    """Return normalized Miller–Bravais indices, using smallest integers, for each plane."""
 
-    for factor in (1, 3):
-        scaled = [round(v * factor) for v in values]
-        if all(abs(v * factor - s) < 1e-5 for v, s in zip(values, scaled)):
-            values = scaled
-            break
-    else:
-        values = [round(v) for v in values]
+    raw = planes_three_to_four_batch(hkls)
+    unit, third = np.round(raw), np.round(raw * 3)
+    # Prefer the indices as-is, then scaled by 3 (the transform divides by 3).
+    use_third = ~(np.abs(raw - unit) < 1e-5).all(axis=1) & (np.abs(raw * 3 - third) < 1e-5).all(axis=1)
+    values = np.where(use_third[:, None], third, unit).astype(int)
+    divisor = np.gcd.reduce(np.abs(values), axis=1)
+    divisor[divisor == 0] = 1
+    return list(map(tuple, (values // divisor[:, None]).tolist()))
+
+
+def _d_spacings(g_star: np.ndarray, hkls: np.ndarray) -> np.ndarray:
+    """``Lattice.d_hkl`` for each row of ``hkls`` given the reciprocal metric ``g_star``."""
+
+    # A stacked matmul rounds exactly like d_hkl's np.dot calls.
+    quad = ((hkls @ g_star)[:, None, :] @ hkls[:, :, None])[:, 0, 0]
+    return 1 / quad ** (1 / 2)
 
-    non_zero = [abs(int(v)) for v in values if v]
-    divisor = gcd(*non_zero) if non_zero else 1
-    divisor = divisor or 1
-    return tuple(int(v / divisor) for v in values)
 
+class _SaedCalculator(TEMCalculator):
+    """TEMCalculator reusing one reciprocal metric for every d-spacing lookup.
 
-def _plane_three_to_four_normalized(hkl: Sequence[float]) -> tuple[int, int, int, int]:
-    raw = plane_three_to_four(hkl)
-    return _normalize_four_index(raw)
+    pymatgen's ``Lattice.d_hkl`` inverts the lattice matrix on every call, and
+    ``get_positions`` looks up spacings for every reflection several times.
+    """
 
+    def __init__(self, g_star: np.ndarray, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.g_star = g_star
 
-def _zone_axis_dot(hkl: Sequence[int], zone_axis: tuple[int, int, int]) -> int:
-    """Return the zone law dot product u*h + v*k + w*l for integer indices."""
+    def get_interplanar_spacings(self, structure: Structure, points) -> dict:
+        points_filtered = self.zone_axis_filter(points)
+        if (0, 0, 0) in points_filtered:
+            points_filtered.remove((0, 0, 0))
+        if not points_filtered:
+            return {}
+        d_values = _d_spacings(self.g_star, np.array(points_filtered, dtype=int))
+        return dict(zip(points_filtered, d_values, strict=True))
 
-    h, k, l = (int(hkl[0]), int(hkl[1]), int(hkl[2]))
-    u, v, w = zone_axis
-    return u * h + v * k + w * l
+
+def _zone_interplanar_spacings(points: np.ndarray, g_star: np.ndarray, cfg: SaedConfig) -> dict:
+    """Return ``{hkl: d}`` for the non-zero ``points`` in the configured Laue zone.
+
+    Equivalent to filtering ``points`` one by one and calling
+    ``TEMCalculator.get_interplanar_spacings``, but evaluated on the whole
+    (2N+1)^3 grid at once; tuples are only built for surviving reflections.
+    """
+
+    points = np.asarray(points, dtype=int)
+    # Enforce the crystallographic zone law: u*h + v*k + w*l = laue_zone.
+    # This keeps the rendered spots consistent with the zone-axis selection in the UI.
+    mask = points.any(axis=1) & (points @ np.asarray(cfg.zone_axis) == cfg.laue_zone)
+    hkls = points[mask]
+    d_values = _d_spacings(g_star, hkls)
+    if cfg.min_d_angstrom:
+        keep = d_values >= cfg.min_d_angstrom
+        hkls, d_values = hkls[keep], d_values[keep]
+    return dict(zip(map(tuple, hkls.tolist()), d_values, strict=True))
 
 
 def compute_saed_pattern(structure: Structure, *, config: SaedConfig | None = None, **kwargs) -> dict:
     cfg = config or SaedConfig.from_payload(structure, kwargs)
     hex_lattice = is_hexagonal_lattice(structure.lattice)
 
-    calculator = TEMCalculator(
+    g_star = structure.lattice.reciprocal_lattice_crystallographic.metric_tensor
+    calculator = _SaedCalculator(
+        g_star,
         voltage=cfg.voltage_kv,
         beam_direction=cfg.zone_axis,
         camera_length=cfg.camera_length_cm,
@@ -186,15 +233,7 @@ def compute_saed_pattern(structure: Structure, *, config: SaedConfig | None = No
     wavelength = calculator.wavelength_rel()
 
     points = calculator.generate_points(coord_left=-cfg.max_index, coord_right=cfg.max_index)
-    points = [tuple(map(int, p)) for p in points if max(abs(int(v)) for v in p) <= cfg.max_index]
-    points = [p for p in points if any(p)]
-    # Enforce the crystallographic zone law: u*h + v*k + w*l = laue_zone.
-    # This keeps the rendered spots consistent with the zone-axis selection in the UI.
-    zone_filtered = [hkl for hkl in points if _zone_axis_dot(hkl, cfg.zone_axis) == cfg.laue_zone]
-
-    d_map = calculator.get_interplanar_spacings(structure, zone_filtered)
-    if cfg.min_d_angstrom:
-        d_map = {hkl: d for hkl, d in d_map.items() if d >= cfg.min_d_angstrom}
+    d_map = _zone_interplanar_spacings(points, g_star, cfg)
     if not d_map:
         raise ValidationError("No reflections remain after d-spacing filtering")
 
@@ -204,61 +243,69 @@ def compute_saed_pattern(structure: Structure, *, config: SaedConfig | None = No
     positions = calculator.get_positions(structure, list(bragg_map.keys()))
     s2_map = calculator.get_s2(bragg_map)
 
-    spots: list[SaedSpot] = []
-    x_values: list[float] = []
-    y_values: list[float] = []
-    r_values: list[float] = []
-    intensity_values: list[float] = []
-
     base_rotation_deg = _rotation_angle_for_x_axis(positions, cfg.x_axis_hkl)
     total_rotation_rad = math.radians(base_rotation_deg + cfg.inplane_rotation_deg)
 
-    for hkl, theta in bragg_map.items():
+    kept = [hkl for hkl in bragg_map if float(intensity_norm.get(hkl, 0.0)) >= cfg.intensity_min_relative]
+    if not kept:
+        raise ValidationError("No reflections meet the intensity threshold")
+
+    # Rotate every spot at once; written element-wise so each value rounds
+    # exactly as the scalar expressions did.
+    xy = np.array([positions[hkl] for hkl in kept], dtype=float)
+    cos_r, sin_r = math.cos(total_rotation_rad), math.sin(total_rotation_rad)
+    x_rot = cos_r * xy[:, 0] - sin_r * xy[:, 1]
+    y_rot = sin_r * xy[:, 0] + cos_r * xy[:, 1]
+    r_cm = np.sqrt(x_rot**2 + y_rot**2)
+
+    norm_scale = max(float(np.abs(x_rot).max()), float(np.abs(y_rot).max()), 1e-9)
+    if cfg.normalize_position:
+        x_norm, y_norm = (x_rot / norm_scale).tolist(), (y_rot / norm_scale).tolist()
+    else:
+        x_norm = y_norm = [0.0] * len(kept)
+
+    labels = ["".join(map(str, hkl)) for hkl in kept]
+    hkils = _planes_three_to_four_normalized(kept) if hex_lattice else [None] * len(kept)
+
+    spots: list[SaedSpot] = []
+    intensity_values: list[float] = []
+    for index, (hkl, x_cm, y_cm, x_r, y_r, r) in enumerate(
+        zip(
+            kept,
+            xy[:, 0].tolist(),
+            xy[:, 1].tolist(),
+            x_rot.tolist(),
+            y_rot.tolist(),
+            r_cm.tolist(),
+            strict=True,
+        )
+    ):
         i_rel = float(intensity_norm.get(hkl, 0.0))
-        if i_rel < cfg.intensity_min_relative:
-            continue
-
-        pos = positions[hkl]
-        x_cm, y_cm = float(pos[0]), float(pos[1])
-        cos_r, sin_r = math.cos(total_rotation_rad), math.sin(total_rotation_rad)
-        x_rot = cos_r * x_cm - sin_r * y_cm
-        y_rot = sin_r * x_cm + cos_r * y_cm
-        r_cm = math.sqrt(x_rot**2 + y_rot**2)
-
-        x_values.append(x_rot)
-        y_values.append(y_rot)
-        r_values.append(r_cm)
         intensity_values.append(i_rel)
-
-        two_theta = math.degrees(2 * theta)
         s2_val = s2_map.get(hkl)
-        hkil_norm = _plane_three_to_four_normalized(hkl) if hex_lattice else None
-
+        i_raw = float(intensity_raw.get(hkl, 0.0))
         spots.append(
             SaedSpot(
-                hkl=tuple(int(v) for v in hkl),
+                hkl=hkl,
                 zone=cfg.laue_zone,
                 d_angstrom=float(d_map[hkl]),
                 s2=float(s2_val) if s2_val is not None else None,
-                intensity_raw=float(intensity_raw.get(hkl, 0.0)),
-                intensity_rel=i_rel if cfg.normalize_intensity else float(intensity_raw.get(hkl, 0.0)),
+                intensity_raw=i_raw,
+                intensity_rel=i_rel if cfg.normalize_intensity else i_raw,
                 x_cm=x_cm,
                 y_cm=y_cm,
-                x_rot_cm=x_rot,
-                y_rot_cm=y_rot,
-                x_norm=0.0,
-                y_norm=0.0,
-                r_cm=r_cm,
-                two_theta_deg=two_theta,
-                label="".join(str(int(v)) for v in hkl),
-                hkil=hkil_norm,
+                x_rot_cm=x_r,
+                y_rot_cm=y_r,
+                x_norm=x_norm[index],
+                y_norm=y_norm[index],
+                r_cm=r,
+                two_theta_deg=math.degrees(2 * bragg_map[hkl]),
+                label=labels[index],
+                hkil=hkils[index],
             )
         )
 
-    if not spots:
-        raise ValidationError("No reflections meet the intensity threshold")
-
-    origin_intensity = max(intensity_values) if intensity_values else 1.0
+    origin_intensity = max(intensity_values)
     spots.append(
         SaedSpot(
             hkl=(0, 0, 0),
@@ -278,25 +325,12 @@ def compute_saed_pattern(structure: Structure, *, config: SaedConfig | None = No
             label="000",
         )
     )
-    x_values.append(0.0)
-    y_values.append(0.0)
-    r_values.append(0.0)
-    intensity_values.append(origin_intensity)
-
-    x_min, x_max = min(x_values), max(x_values)
-    y_min, y_max = min(y_values), max(y_values)
-    r_max = max(r_values) if r_values else 0.0
-    i_max = max(intensity_values) if intensity_values else 0.0
-
-    norm_scale = max(
-        max((abs(x) for x in x_values), default=0.0),
-        max((abs(y) for y in y_values), default=0.0),
-        1e-9,
-    )
-    if cfg.normalize_position:
-        for spot in spots:
-            spot.x_norm = spot.x_rot_cm / norm_scale
-            spot.y_norm = spot.y_rot_cm / norm_scale
+
+    # The origin spot sits at (0, 0) with the strongest intensity.
+    x_min, x_max = min(float(x_rot.min()), 0.0), max(float(x_rot.max()), 0.0)
+    y_min, y_max = min(float(y_rot.min()), 0.0), max(float(y_rot.max()), 0.0)
+    r_max = max(float(r_cm.max()), 0.0)
+    i_max = origin_intensity
 
     metadata = {
         "phase_name": cfg.phase_name or structure.composition.reduced_formula,
@@ -327,10 +361,14 @@ def compute_saed_pattern(structure: Structure, *, config: SaedConfig | None = No
         "norm_scale": norm_scale,
     }
 
+    # Strongest first; a stable sort keeps equal intensities in reflection order.
+    intensities = np.fromiter((spot.intensity_rel for spot in spots), dtype=float, count=len(spots))
+    order = np.argsort(-intensities, kind="stable").tolist()
+
     payload = {
         "metadata": metadata,
         "limits": limits,
-        "spots": [asdict(spot) for spot in sorted(spots, key=lambda s: s.intensity_rel, reverse=True)],
+        "spots": [spots[index].to_dict() for index in order],
     }
 
     return payload
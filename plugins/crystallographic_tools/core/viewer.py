@@ -17,6 +17,13 @@ from . import structure as structure_core
 MAX_ATOMS_IN_VIEW = 500
 DEFAULT_SUPERCELL = (3, 3, 3)
 MAX_SUPERCELL = (4, 4, 4)
+_FORMAT_SNIFF_CHARS = 4096
+
+SPACE_GROUP_CACHE_SIZE = 64
+# structure_digest() -> (space group symbol, number).
+_SPACE_GROUP_CACHE: structure_core.DigestLRUCache[tuple[str, int | None]] = (
+    structure_core.DigestLRUCache(SPACE_GROUP_CACHE_SIZE)
+)
 
 
 def _guess_format(filename: str | None, text: str) -> str:
@@ -27,11 +34,16 @@ def _guess_format(filename: str | None, text: str) -> str:
         if suffix in {".vasp", ".poscar", ".contcar"}:
             return "poscar"
 
+    # Only the head of the text decides the format; avoid lower-casing or
+    # splitting a multi-megabyte upload just to inspect its first lines.
     normalized = text.lstrip()
-    if normalized.lower().startswith("data_") or "_cell_length_a" in normalized:
+    if normalized[:5].lower() == "data_" or "_cell_length_a" in normalized:
         return "cif"
-    lines = normalized.splitlines()
-    if len(lines) >= 6 and lines[5].strip().lower() in {"direct", "cartesian"}:
+    lines = normalized[:_FORMAT_SNIFF_CHARS].splitlines()
+    # The coordinate mode follows the counts line (line 6 in VASP 4 files,
+    # line 7 after a VASP 5 species line), optionally after a
+    # "Selective dynamics" line.
+    if any(line.strip().lower() in {"direct", "cartesian"} for line in lines[6:9]):
         return "poscar"
     return "unknown"
 
@@ -78,10 +90,6 @@ def parse_structure_bytes(data: bytes, *, filename: str | None = None) -> Struct
     raise ValidationError("Unable to parse structure as CIF or POSCAR") from last_error
 
 
-def _wrap_frac(frac_coords: Sequence[float]) -> list[float]:
-    return [float(coord % 1.0) for coord in frac_coords]
-
-
 def _validate_supercell(supercell: Iterable[int] | None) -> tuple[int, int, int]:
     if supercell is None:
         return DEFAULT_SUPERCELL
@@ -98,43 +106,80 @@ def _validate_supercell(supercell: Iterable[int] | None) -> tuple[int, int, int]
     return values  # type: ignore[return-value]
 
 
-def _space_group_info(structure: Structure) -> Mapping[str, object]:
+def _analyze_space_group(structure: Structure) -> tuple[str, int | None]:
     try:
         analyzer = SpacegroupAnalyzer(structure, symprec=1e-3, angle_tolerance=0.5)
         symbol, number = analyzer.get_space_group_symbol(), analyzer.get_space_group_number()
     except Exception:  # pragma: no cover - spglib edge cases
         symbol, number = "P1", 1
-    return {"symbol": symbol, "number": int(number) if number else None}
+    return symbol, int(number) if number else None
+
+
+def _space_group_info(
+    structure: Structure, *, digest: bytes | None = None
+) -> Mapping[str, object]:
+    # spglib dominates viewer payloads for repeat requests on the same file,
+    # so the result is cached by structure content.
+    key = digest if digest is not None else structure_core.structure_digest(structure)
+    symbol, number = _SPACE_GROUP_CACHE.get_or_compute(
+        key, lambda: _analyze_space_group(structure)
+    )
+    return {"symbol": symbol, "number": number}
+
+
+def _species_entry(composition) -> tuple[str, float, int | None]:
+    species = sorted(composition.items(), key=lambda item: item[1], reverse=True)
+    primary, occupancy = species[0]
+    atomic_number = getattr(primary, "Z", None) or getattr(primary, "z", None)
+    return str(primary), float(occupancy), int(atomic_number) if atomic_number else None
 
 
 def _basis_sites(structure: Structure) -> list[Mapping[str, object]]:
     radii = covalent_radii_map()
+    # Supercell sites share Composition objects; describe each distinct one once.
+    entries: dict[int, tuple[str, float, int | None] | None] = {}
+    frac_positions = (structure.frac_coords % 1.0).tolist()
+    cart_positions = structure.cart_coords.tolist()
     basis = []
-    for site in structure.sites:
-        species = sorted(site.species.items(), key=lambda item: item[1], reverse=True)
-        if not species:
+    for site, frac_position, cart_position in zip(
+        structure, frac_positions, cart_positions, strict=True
+    ):
+        composition = site.species
+        key = id(composition)
+        if key not in entries:
+            entries[key] = _species_entry(composition) if composition else None
+        entry = entries[key]
+        if entry is None:
             continue
-        primary, occupancy = species[0]
-        element = str(primary)
-        atomic_number = getattr(primary, "Z", None) or getattr(primary, "z", None)
+        element, occupancy, atomic_number = entry
         basis.append(
             {
                 "element": element,
-                "frac_position": _wrap_frac(site.frac_coords),
-                "cart_position": [float(x) for x in site.coords],
-                "occupancy": float(occupancy),
-                "atomic_number": int(atomic_number) if atomic_number else None,
+                "frac_position": frac_position,
+                "cart_position": cart_position,
+                "occupancy": occupancy,
+                "atomic_number": atomic_number,
                 "atomic_radius": radii.get(element),
             }
         )
     return basis
 
 
-def structure_to_viewer_payload(structure: Structure, *, supercell: Iterable[int] | None = None) -> dict:
+def structure_to_viewer_payload(
+    structure: Structure,
+    *,
+    supercell: Iterable[int] | None = None,
+    include_cif: bool = True,
+    columnar_sites: bool = False,
+) -> dict:
     """Normalize a :class:`Structure` to a JSON-ready viewer payload."""
 
     requested_supercell = _validate_supercell(supercell)
-    base_payload = structure_core.structure_to_payload(structure)
+    # One content digest keys both the CIF text and space group caches.
+    digest = structure_core.structure_digest(structure)
+    base_payload = structure_core.structure_to_payload(
+        structure, include_cif=include_cif, columnar_sites=columnar_sites, digest=digest
+    )
     basis = _basis_sites(structure)
     atom_count = len(basis)
     supercell_atoms = atom_count * requested_supercell[0] * requested_supercell[1] * requested_supercell[2]
@@ -147,7 +192,7 @@ def structure_to_viewer_payload(structure: Structure, *, supercell: Iterable[int
     payload = {
         **base_payload,
         "lattice_matrix": [[float(x) for x in row] for row in structure.lattice.matrix],
-        "space_group": _space_group_info(structure),
+        "space_group": _space_group_info(structure, digest=digest),
         "basis": basis,
         "viewer_limits": {
             "max_atoms": MAX_ATOMS_IN_VIEW,
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import cos, radians, sin, sqrt, tan
-from typing import Iterable, List
+from math import log, sqrt, tan
+from typing import List
 
 import numpy as np
+from pymatgen.analysis.diffraction.core import DiffractionPattern
 from pymatgen.analysis.diffraction.xrd import XRDCalculator
 from pymatgen.core import Structure
 
+from .structure import DigestLRUCache, structure_digest
+
+PATTERN_CACHE_SIZE = 64
+# (structure_digest(), wavelength, 2-theta min, 2-theta max) -> pymatgen pattern.
+_PATTERN_CACHE: DigestLRUCache[DiffractionPattern] = DigestLRUCache(PATTERN_CACHE_SIZE)
+
 
 @dataclass(slots=True)
 class XrdInstrumentConfig:
@@ -55,6 +62,17 @@ class XrdRangeConfig:
             two_theta_step=float(payload.get("step", 0.02)),
         )
 
+    def grid(self) -> np.ndarray:
+        """Return the 2-theta sample points from the minimum to the maximum.
+
+        The point count is derived once from the range so it does not depend on
+        ``np.arange`` rounding, and each point is ``min + i * step``.
+        """
+
+        span = (self.two_theta_max - self.two_theta_min) / self.two_theta_step
+        count = max(int(np.floor(span + 1e-9)) + 1, 0)
+        return self.two_theta_min + np.arange(count) * self.two_theta_step
+
 
 @dataclass(slots=True)
 class PeakProfile:
@@ -77,21 +95,80 @@ class PeakProfile:
         )
 
     def fwhm(self, theta_rad: float) -> float:
-        return sqrt(max(self.u * tan(theta_rad) ** 2 + self.v * tan(theta_rad) + self.w, 1e-6))
+        tan_theta = tan(theta_rad)
+        return sqrt(max(self.u * tan_theta**2 + self.v * tan_theta + self.w, 1e-6))
 
+    def fwhm_array(self, theta_rad: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`fwhm` for an array of Bragg angles."""
 
-def _lorentz_polarization_factor(theta_rad: float, polarization_ratio: float | None, geometry: str) -> float:
-    lorentz = 1 / max(sin(theta_rad) ** 2 * cos(theta_rad), 1e-9)
-    ratio = polarization_ratio if polarization_ratio is not None else 0.5
-    polarization = (1 + ratio * cos(2 * theta_rad) ** 2) / (1 + ratio)
+        tan_theta = np.tan(theta_rad)
+        return np.sqrt(np.maximum(self.u * tan_theta**2 + self.v * tan_theta + self.w, 1e-6))
+
+
+def _lorentz_polarization_factors(theta_rad: np.ndarray, polarization_ratio: float | None, geometry: str) -> np.ndarray:
+    """Return the Lorentz-polarization factor for each Bragg angle in ``theta_rad``."""
+
+    sin_theta, cos_theta = np.sin(theta_rad), np.cos(theta_rad)
     if geometry == "transmission":
-        lorentz = 1 / max(sin(theta_rad) ** 2, 1e-9)
+        lorentz = 1 / np.maximum(sin_theta**2, 1e-9)
+    else:
+        lorentz = 1 / np.maximum(sin_theta**2 * cos_theta, 1e-9)
+    ratio = polarization_ratio if polarization_ratio is not None else 0.5
+    polarization = (1 + ratio * np.cos(2 * theta_rad) ** 2) / (1 + ratio)
     return lorentz * polarization
 
 
-def _gaussian_profile(xs: Iterable[float], center: float, amplitude: float, fwhm_deg: float) -> np.ndarray:
-    sigma = fwhm_deg / (2 * sqrt(2 * np.log(2)))
-    return amplitude * np.exp(-0.5 * ((np.asarray(xs) - center) / sigma) ** 2)
+# FWHM of a Gaussian in units of its standard deviation.
+_FWHM_PER_SIGMA = 2 * sqrt(2 * log(2))
+
+# exp(-x**2 / 2) underflows to exactly 0.0 beyond ~38.6 sigma, so a peak
+# contributes nothing to grid points further than this from its centre.
+GAUSSIAN_CUTOFF_SIGMA = 40.0
+
+
+def _gaussian_profiles(xs: np.ndarray, centers: np.ndarray, amplitudes: np.ndarray, fwhm_deg: np.ndarray) -> np.ndarray:
+    """Return the sum of one Gaussian per peak evaluated on the sorted grid ``xs``.
+
+    Each peak is evaluated only on the window of ``xs`` where it is non-zero,
+    which gives the same sums as evaluating it on the whole grid.
+    """
+
+    sigmas = fwhm_deg / _FWHM_PER_SIGMA
+    reach = GAUSSIAN_CUTOFF_SIGMA * sigmas
+    lows = np.searchsorted(xs, centers - reach, side="left").tolist()
+    highs = np.searchsorted(xs, centers + reach, side="right").tolist()
+    # exp(-(x - c)**2 / (2 sigma**2)) with the per-peak factor folded into one
+    # multiplier, evaluated in place on a single window-sized buffer.
+    exponent_scales = (-0.5 / (sigmas * sigmas)).tolist()
+    ys = np.zeros_like(xs, dtype=float)
+    for center, amplitude, scale, low, high in zip(
+        centers.tolist(), amplitudes.tolist(), exponent_scales, lows, highs, strict=True
+    ):
+        term = xs[low:high] - center
+        term *= term
+        term *= scale
+        np.exp(term, out=term)
+        term *= amplitude
+        ys[low:high] += term
+    return ys
+
+
+def _diffraction_pattern(
+    structure: Structure, wavelength: float | str, two_theta_range: tuple[float, float]
+) -> DiffractionPattern:
+    """Return pymatgen's XRD pattern, reusing it for identical structure and settings.
+
+    The structure-factor sum dominates XRD requests and clients recompute the
+    same structure while only tuning the profile or step; the returned pattern
+    is shared and must not be modified.
+    """
+
+    key = (structure_digest(structure), wavelength, *two_theta_range)
+    calculator = XRDCalculator(wavelength=wavelength)
+    return _PATTERN_CACHE.get_or_compute(
+        key,
+        lambda: calculator.get_pattern(structure, two_theta_range=two_theta_range),
+    )
 
 
 def compute_xrd_peaks(
@@ -117,57 +194,75 @@ def compute_xrd_pattern(
     instrument_config: XrdInstrumentConfig | None = None,
     range_config: XrdRangeConfig | None = None,
     profile_config: PeakProfile | None = None,
+    columnar_curve: bool = False,
 ) -> dict:
-    """Compute powder XRD peaks, Lorentz-polarization factors, and a broadened spectrum."""
+    """Compute powder XRD peaks, Lorentz-polarization factors, and a broadened spectrum.
+
+    With ``columnar_curve=True`` the per-point dicts in ``curve`` are replaced
+    by parallel ``curve_two_theta`` / ``curve_intensity`` lists, which are
+    cheaper to build and serialize for fine 2-theta steps.
+    """
 
     instrument = instrument_config or XrdInstrumentConfig()
     tth_range = range_config or XrdRangeConfig()
     profile = profile_config or PeakProfile()
 
-    calculator = XRDCalculator(wavelength=instrument.wavelength)
-    pattern = calculator.get_pattern(
+    pattern = _diffraction_pattern(
         structure,
-        two_theta_range=(tth_range.two_theta_min, tth_range.two_theta_max),
+        instrument.wavelength,
+        (tth_range.two_theta_min, tth_range.two_theta_max),
     )
-    peaks: List[dict] = []
-    scaled_intensities: list[float] = []
-
-    for i, two_theta in enumerate(pattern.x):
-        theta_rad = radians(two_theta / 2)
-        lp_factor = _lorentz_polarization_factor(theta_rad, instrument.polarization_ratio, instrument.geometry)
-        base_intensity = float(pattern.y[i])
-        scaled_intensity = base_intensity * lp_factor
-        scaled_intensities.append(scaled_intensity)
-        peaks.append(
-            {
-                "two_theta": float(two_theta),
-                "intensity": base_intensity,
-                "intensity_lp": scaled_intensity,
-                "d_spacing": float(pattern.d_hkls[i]),
-                "hkl": pattern.hkls[i][0]["hkl"] if pattern.hkls[i] else [],
-                "lorentz_polarization": lp_factor,
-            }
+    # Numeric phase: every per-peak quantity stays a NumPy array.
+    two_thetas = np.asarray(pattern.x, dtype=float)
+    theta_rad = np.radians(two_thetas / 2)
+    base_intensities = np.asarray(pattern.y, dtype=float)
+    lp_factors = _lorentz_polarization_factors(theta_rad, instrument.polarization_ratio, instrument.geometry)
+    scaled_intensities = base_intensities * lp_factors
+
+    xs = tth_range.grid()
+    ys = _gaussian_profiles(xs, two_thetas, scaled_intensities, profile.fwhm_array(theta_rad))
+
+    max_int = float(ys.max(initial=0.0)) or 1.0
+    normalized = scaled_intensities / max_int * 100.0
+
+    # Serialization phase: Python objects are built once, column by column.
+    peaks: List[dict] = [
+        {
+            "two_theta": two_theta,
+            "intensity": base_intensity,
+            "intensity_lp": scaled_intensity,
+            "d_spacing": d_spacing,
+            "hkl": hkls[0]["hkl"] if hkls else [],
+            "lorentz_polarization": lp_factor,
+            "intensity_normalized": intensity_normalized,
+        }
+        for two_theta, base_intensity, scaled_intensity, lp_factor, d_spacing, hkls, intensity_normalized in zip(
+            two_thetas.tolist(),
+            base_intensities.tolist(),
+            scaled_intensities.tolist(),
+            lp_factors.tolist(),
+            np.asarray(pattern.d_hkls, dtype=float).tolist(),
+            pattern.hkls,
+            normalized.tolist(),
+            strict=True,
         )
-
-    xs = np.arange(tth_range.two_theta_min, tth_range.two_theta_max + tth_range.two_theta_step, tth_range.two_theta_step)
-    ys = np.zeros_like(xs, dtype=float)
-    for peak, scaled_intensity in zip(peaks, scaled_intensities):
-        theta_rad = radians(peak["two_theta"] / 2)
-        fwhm_deg = profile.fwhm(theta_rad)
-        ys += _gaussian_profile(xs, peak["two_theta"], scaled_intensity, fwhm_deg)
-
-    max_int = float(np.max(ys)) if np.any(ys) else 1.0
-    curve = [
-        {"two_theta": float(x), "intensity": float((y / max_int) * 100.0)}
-        for x, y in zip(xs, ys)
     ]
 
-    for peak, scaled_intensity in zip(peaks, scaled_intensities):
-        peak["intensity_normalized"] = (scaled_intensity / max_int) * 100.0 if max_int else 0.0
+    curve_two_theta = xs.tolist()
+    curve_intensity = (ys / max_int * 100.0).tolist()
+    if columnar_curve:
+        curve_fields: dict = {"curve_two_theta": curve_two_theta, "curve_intensity": curve_intensity}
+    else:
+        curve_fields = {
+            "curve": [
+                {"two_theta": x, "intensity": y}
+                for x, y in zip(curve_two_theta, curve_intensity, strict=True)
+            ]
+        }
 
     return {
         "peaks": peaks,
-        "curve": curve,
+        **curve_fields,
         "range": {
             "min": tth_range.two_theta_min,
             "max": tth_range.two_theta_max,
@@ -187,7 +282,7 @@ def compute_xrd_pattern(
         },
         "summary": {
             "peak_count": len(peaks),
-            "max_intensity": max(scaled_intensities) if scaled_intensities else 0.0,
+            "max_intensity": float(scaled_intensities.max()) if len(scaled_intensities) else 0.0,
         },
     }
 
@@ -77,6 +77,18 @@ def test_load_cif_endpoint():
     assert data["data"]["lattice"]["a"] == 5.431
 
 
+def test_load_cif_can_skip_cif_text():
+    client = _client()
+    resp = client.post(
+        "/api/crystallographic_tools/load_cif?include_cif=0",
+        data={"file": (BytesIO(SIMPLE_CIF), "si.cif")},
+    )
+    assert resp.status_code == 200
+    payload = resp.get_json()["data"]
+    assert payload["cif"] is None
+    assert payload["sites"]
+
+
 def test_edit_cif_endpoint():
     client = _client()
     resp = client.post(
@@ -100,6 +112,29 @@ def test_xrd_endpoint():
     assert payload["curve"]
 
 
+def test_xrd_endpoint_columnar_curve():
+    client = _client()
+    resp = client.post(
+        "/api/crystallographic_tools/xrd",
+        json={"cif": SIMPLE_CIF.decode(), "two_theta": {"min": 20, "max": 80, "step": 0.1}, "columnar_curve": True},
+    )
+    payload = resp.get_json()["data"]
+    assert "curve" not in payload
+    assert len(payload["curve_two_theta"]) == len(payload["curve_intensity"]) > 0
+
+
+@pytest.mark.parametrize(
+    ("body", "code"),
+    [({}, "crystallography.missing_cif"), ({"cif": "not a cif"}, "crystallography.invalid_cif")],
+)
+@pytest.mark.parametrize("route", ["xrd", "tem_saed", "calculator"])
+def test_structure_routes_report_cif_errors(route, body, code):
+    client = _client()
+    resp = client.post(f"/api/crystallographic_tools/{route}", json=body)
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["code"] == code
+
+
 def test_tem_saed_endpoint():
     client = _client()
     resp = client.post(
@@ -180,6 +215,16 @@ def test_crystal_viewer_element_radii():
     assert resp.status_code == 200
     payload = resp.get_json()["data"]
     assert payload["Fe"] > 0
+    assert resp.headers["ETag"]
+    assert "no-cache" in resp.headers["Cache-Control"]
+    assert "immutable" not in resp.headers["Cache-Control"]
+
+    cached = client.get(
+        "/api/crystallographic_tools/crystal_viewer/element_radii",
+        headers={"If-None-Match": resp.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.data == b""
 
 
 def test_crystal_viewer_export_structure_respects_limits(simple_cif_bytes):
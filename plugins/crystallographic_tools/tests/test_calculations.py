@@ -34,3 +34,33 @@ def test_angles_and_equivalents(simple_cif_bytes):
     equivalents = calculations.symmetry_equivalents(s, [1, 0, 0], kind="direction")
     assert [1, 0, 0] in equivalents
     assert [-1, 0, 0] in equivalents
+
+    rotations = calculations.symmetry_rotations(s)
+    assert rotations.shape[1:] == (3, 3)
+    assert (
+        calculations.symmetry_equivalents(
+            s, [1, 0, 0], kind="direction", rotations=rotations
+        )
+        == equivalents
+    )
+
+
+def test_four_index_batches_match_scalar_conversions():
+    vecs = [[1, 0, 0], [1, 1, 0], [2, -1, 3], [0.5, 0.25, 1.0]]
+    assert calculations.directions_three_to_four_batch(vecs).tolist() == [
+        calculations.direction_three_to_four(vec) for vec in vecs
+    ]
+    assert calculations.planes_three_to_four_batch(vecs).tolist() == [
+        calculations.plane_three_to_four(vec) for vec in vecs
+    ]
+    assert calculations.directions_three_to_four_batch([]).tolist() == []
+
+
+def test_symmetry_rotations_are_cached_by_content(simple_cif_bytes):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    rotations = calculations.symmetry_rotations(s)
+    assert calculations.symmetry_rotations(s.copy()) is rotations
+    assert not rotations.flags.writeable
+
+    edited = structure.edit_structure(s, lattice_params={"a": 6.0, "b": 6.0, "c": 6.0})
+    assert calculations.symmetry_rotations(edited) is not rotations
@@ -30,6 +30,25 @@ def test_parse_and_payload(simple_cif_bytes):
     assert "Si" in payload["formula"]
 
 
+def test_parse_returns_independent_copies(simple_cif_bytes):
+    first = structure.parse_cif_bytes(simple_cif_bytes)
+    first.replace(0, "Ge")
+    second = structure.parse_cif_bytes(simple_cif_bytes)
+    assert str(second[0].specie) == "Si"
+    assert second is not first
+
+
+def test_payload_columnar_sites_match_records(simple_cif_bytes):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    records = structure.structure_to_payload(s, include_cif=False)
+    columns = structure.structure_to_payload(s, include_cif=False, columnar_sites=True)
+    assert "sites" not in columns
+    assert columns["sites_species"] == [site["species"] for site in records["sites"]]
+    assert columns["sites_frac_coords"] == [
+        site["frac_coords"] for site in records["sites"]
+    ]
+
+
 def test_edit_lattice(simple_cif_bytes):
     s = structure.parse_cif_bytes(simple_cif_bytes)
     updated = structure.edit_structure(s, lattice_params={"a": 6.0, "b": 6.0, "c": 6.0})
@@ -58,3 +77,40 @@ def test_parse_allows_high_occupancy_cif():
     parsed = structure.parse_cif_bytes(_OCCUPANCY_CIF)
     assert parsed.num_sites >= 2
     assert parsed.lattice.a == pytest.approx(5.431)
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [
+        [0.1, 0.2],
+        ["x", 0, 0],
+        [None, 0, 0],
+        [float("nan"), 0, 0],
+    ],
+)
+def test_edit_sites_rejects_invalid_coords(simple_cif_bytes, coords):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    sites = [{} for _ in s]
+    sites[0] = {"frac_coords": coords}
+    with pytest.raises(structure.ValidationError):
+        structure.edit_structure(s, sites=sites)
+
+
+def test_structure_to_cif_reuses_text_for_identical_content(simple_cif_bytes):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    text = structure.structure_to_cif(s)
+    assert text == s.to(fmt="cif")
+    assert structure.structure_to_cif(s.copy()) is text
+
+    edited = structure.edit_structure(s, lattice_params={"a": 6.0, "b": 6.0, "c": 6.0})
+    assert structure.structure_to_cif(edited) == edited.to(fmt="cif")
+
+
+def test_digest_lru_cache_evicts_least_recently_used():
+    cache = structure.DigestLRUCache(2)
+    assert cache.get_or_compute(b"a", lambda: "A") == "A"
+    assert cache.get_or_compute(b"b", lambda: "B") == "B"
+    assert cache.get_or_compute(b"a", lambda: "stale") == "A"
+    cache.get_or_compute(b"c", lambda: "C")
+    assert cache.get_or_compute(b"a", lambda: "stale") == "A"
+    assert cache.get_or_compute(b"b", lambda: "B2") == "B2"
@@ -75,3 +75,46 @@ def test_bcc_zone_axis_dot_rule_111():
     hkls = {tuple(spot["hkl"]) for spot in pattern["spots"]}
     assert all(sum(hkl[i] * zone_axis[i] for i in range(3)) == 0 for hkl in hkls)
     assert any(sorted(map(abs, hkl)) == [0, 1, 1] for hkl in hkls if hkl != (0, 0, 0))
+
+
+def test_zone_interplanar_spacings_match_per_reflection_loop():
+    fe_path = TEST_DATA / "fe_bcc.cif"
+    s = structure.parse_cif_bytes(fe_path.read_bytes())
+    cfg = tem.SaedConfig.from_payload(s, {"zone_axis": [1, 1, 0], "max_index": 3, "min_d_angstrom": 0.6})
+    points = tem.TEMCalculator.generate_points(-3, 3)
+
+    expected = {}
+    for point in points:
+        hkl = tuple(int(v) for v in point)
+        if any(hkl) and sum(h * u for h, u in zip(hkl, cfg.zone_axis, strict=True)) == 0:
+            d = s.lattice.d_hkl(hkl)
+            if d >= 0.6:
+                expected[hkl] = d
+
+    g_star = s.lattice.reciprocal_lattice_crystallographic.metric_tensor
+    d_map = tem._zone_interplanar_spacings(points, g_star, cfg)
+    assert list(d_map) == list(expected)
+    assert all(d_map[hkl] == expected[hkl] for hkl in expected)
+
+
+def test_spot_to_dict_matches_asdict():
+    from dataclasses import asdict
+
+    spot = tem.SaedSpot(
+        hkl=(1, 1, 0), zone=0, d_angstrom=2.0, s2=None, intensity_raw=3.0, intensity_rel=1.0,
+        x_cm=1.0, y_cm=0.5, x_rot_cm=1.0, y_rot_cm=0.5, x_norm=1.0, y_norm=0.5,
+        r_cm=1.1, two_theta_deg=1.2, label="110", hkil=(1, 1, -2, 0),
+    )
+    assert spot.to_dict() == asdict(spot)
+    assert list(spot.to_dict()) == list(asdict(spot))
+
+
+def test_planes_three_to_four_normalized():
+    hkls = [(1, 0, 0), (1, 1, 0), (0, 0, 2), (1, 0, 1), (-2, 1, 3)]
+    assert tem._planes_three_to_four_normalized(hkls) == [
+        (2, -1, -1, 0),
+        (1, 1, -2, 0),
+        (0, 0, 0, 1),
+        (2, -1, -1, 3),
+        (-5, 4, 1, 9),
+    ]
@@ -1,7 +1,8 @@
 import pytest
 
 from common.validation import ValidationError
-from plugins.crystallographic_tools.core import viewer
+from plugins.crystallographic_tools.core import atomic_radii, viewer
+from plugins.crystallographic_tools.core.atomic_radii import covalent_radii_map
 
 
 def test_structure_to_viewer_payload_contains_basis(simple_cif_bytes):
@@ -24,3 +25,29 @@ def test_supercell_limit_enforced(simple_cif_bytes):
     structure = viewer.parse_structure_bytes(simple_cif_bytes)
     with pytest.raises(ValidationError):
         viewer.structure_to_viewer_payload(structure, supercell=(10, 10, 10))
+
+
+def test_baked_radii_match_pymatgen():
+    assert covalent_radii_map() == atomic_radii._compute_radii()
+
+
+def test_guess_format_from_content(simple_cif_bytes, fe_poscar_bytes):
+    assert viewer._guess_format(None, "DATA_si\n" + "#\n" * 5000) == "cif"
+    assert viewer._guess_format(None, simple_cif_bytes.decode()) == "cif"
+    poscar = "Fe\r\n1.0\r\n2.87 0 0\r\n0 2.87 0\r\n0 0 2.87\r\n2\r\n Direct \r\n0 0 0\r\n" + "0 0 0\r\n" * 2000
+    assert viewer._guess_format(None, poscar) == "poscar"
+    selective = "Fe\n1.0\n2.87 0 0\n0 2.87 0\n0 0 2.87\nFe\n2\nSelective dynamics\nCartesian\n0 0 0 T T T\n"
+    assert viewer._guess_format(None, selective) == "poscar"
+    assert viewer._guess_format(None, fe_poscar_bytes.decode()) == "poscar"
+    assert viewer._guess_format(None, "hello") == "unknown"
+
+
+def test_space_group_info_cached_by_content(simple_cif_bytes, monkeypatch):
+    structure = viewer.parse_structure_bytes(simple_cif_bytes, filename="si.cif")
+    expected = viewer._space_group_info(structure)
+
+    def _fail(_structure):
+        raise AssertionError("space group re-analyzed")
+
+    monkeypatch.setattr(viewer, "_analyze_space_group", _fail)
+    assert viewer._space_group_info(structure.copy()) == expected
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from plugins.crystallographic_tools.core import structure, xrd
@@ -15,3 +16,62 @@ def test_xrd_peaks(simple_cif_bytes):
     assert "hkl" in top_peak
     assert pattern["instrument"]["radiation"] == "CuKa"
     assert pattern["summary"]["peak_count"] == len(peaks)
+
+
+def test_gaussian_profiles_match_full_grid_sum():
+    xs = np.arange(10.0, 80.0, 0.02)
+    centers = np.array([12.0, 30.5, 30.6, 79.9])
+    amplitudes = np.array([5.0, 1.0, 2.0, 3.0])
+    fwhm = xrd.PeakProfile().fwhm_array(np.radians(centers / 2))
+
+    sigmas = fwhm / (2 * np.sqrt(2 * np.log(2)))
+    offsets = (xs - centers[:, None]) / sigmas[:, None]
+    expected = (amplitudes[:, None] * np.exp(-0.5 * offsets**2)).sum(axis=0)
+
+    profiles = xrd._gaussian_profiles(xs, centers, amplitudes, fwhm)
+    assert np.allclose(profiles, expected, rtol=1e-12, atol=0)
+
+
+def test_columnar_curve_matches_records(simple_cif_bytes):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    records = xrd.compute_xrd_pattern(s)
+    columns = xrd.compute_xrd_pattern(s, columnar_curve=True)
+    assert "curve" not in columns
+    assert columns["curve_two_theta"] == [
+        point["two_theta"] for point in records["curve"]
+    ]
+    assert columns["curve_intensity"] == [
+        point["intensity"] for point in records["curve"]
+    ]
+
+
+def test_diffraction_pattern_reused_for_same_structure(simple_cif_bytes, monkeypatch):
+    s = structure.parse_cif_bytes(simple_cif_bytes)
+    first = xrd.compute_xrd_pattern(s, profile_config=xrd.PeakProfile(w=0.1))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("pattern recomputed")
+
+    monkeypatch.setattr(xrd.XRDCalculator, "get_pattern", _fail)
+    second = xrd.compute_xrd_pattern(s.copy(), profile_config=xrd.PeakProfile(w=0.2))
+    assert [p["intensity_lp"] for p in second["peaks"]] == [
+        p["intensity_lp"] for p in first["peaks"]
+    ]
+    assert second["curve"] != first["curve"]
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "step", "count"),
+    [
+        (10.0, 80.0, 0.02, 3501),
+        (10.0, 80.0, 0.03, 2334),
+        (0.1, 0.3, 0.1, 3),
+        (80.0, 10.0, 0.02, 0),
+    ],
+)
+def test_range_grid_stays_within_bounds(start, stop, step, count):
+    grid = xrd.XrdRangeConfig(start, stop, step).grid()
+    assert len(grid) == count
+    if count:
+        assert grid[0] == start
+        assert grid[-1] <= stop + 1e-9
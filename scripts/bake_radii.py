@@ -0,0 +1,57 @@
+"""Regenerate the baked atomic radius table in the crystallographic tools plugin.
+
+Run ``python -m scripts.bake_radii`` from the repository root after upgrading
+pymatgen so ``covalent_radii_map()`` keeps matching the element metadata it was
+derived from.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+
+from plugins.crystallographic_tools.core.atomic_radii import _compute_radii
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TARGET = REPO_ROOT / "plugins" / "crystallographic_tools" / "core" / "atomic_radii.py"
+_BLOCK = re.compile(
+    r"(# BEGIN GENERATED RADII\n).*?(# END GENERATED RADII\n)", re.DOTALL
+)
+
+
+def render(radii: dict[str, float]) -> str:
+    # One entry per line with a trailing comma, which is black's stable layout.
+    lines = ["_RADII: Dict[str, float] = {"]
+    lines.extend(f'    "{symbol}": {radius!r},' for symbol, radius in radii.items())
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Bake pymatgen atomic radii into atomic_radii.py."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the baked table is out of date.",
+    )
+    args = parser.parse_args()
+
+    source = TARGET.read_text(encoding="utf-8")
+    table = render(_compute_radii())
+    updated = _BLOCK.sub(lambda m: m.group(1) + table + m.group(2), source)
+    if updated == source:
+        print(f"{TARGET} is up to date")
+        return 0
+    if args.check:
+        print(f"{TARGET} is out of date; run python -m scripts.bake_radii")
+        return 1
+    TARGET.write_text(updated, encoding="utf-8")
+    print(f"Updated {TARGET}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
 import json
 import re
 
+import pytest
+
 from app import create_app
 
 
@@ -20,3 +22,45 @@ def test_home_lists_plugins():
     assert "PDF Tools" in titles
     assert state.get("page") == "home"
     assert response.headers.get("Content-Security-Policy")
+
+
+def test_plugin_discovery_is_cached():
+    from app import _load_manifests
+    from app.plugins_loader import discover_plugins
+
+    assert discover_plugins() is discover_plugins()
+    first = _load_manifests()
+    second = _load_manifests()
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_apps_do_not_share_mutable_config():
+    first = create_app("TestingConfig")
+    second = create_app("TestingConfig")
+    first.config["PLUGIN_SETTINGS"]["pdf_tools"]["merge_upload"]["max_files"] = 1
+    merge_upload = second.config["PLUGIN_SETTINGS"]["pdf_tools"]["merge_upload"]
+    assert merge_upload["max_files"] == 20
+
+
+def test_react_assets_are_read_only():
+    assets = create_app("TestingConfig").extensions["react_assets"]
+    assert isinstance(assets["scripts"], tuple)
+    with pytest.raises(TypeError):
+        assets["scripts"] = ("/static/react/evil.js",)
+
+
+def test_append_theme_param_fast_path_matches_full_parse():
+    from app import _append_theme_param
+
+    assert _append_theme_param("/tools/pdf_tools", "sunrise") == (
+        "/tools/pdf_tools?theme=sunrise"
+    )
+    assert _append_theme_param("/help/x?theme=old&a=1", "sunrise") == (
+        "/help/x?theme=sunrise&a=1"
+    )
+    assert _append_theme_param("/help/x#top", "sunrise") == "/help/x?theme=sunrise#top"
+    assert _append_theme_param("https://other/x", "sunrise", "local") == (
+        "https://other/x"
+    )
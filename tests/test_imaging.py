@@ -0,0 +1,19 @@
+import numpy as np
+from PIL import Image
+
+from common.imaging import arrays_to_png, image_to_bytes
+
+
+def test_arrays_to_png_encodes_grayscale_once():
+    gray = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    image_png, mask_png = arrays_to_png(gray)
+    assert image_png is mask_png
+    assert image_png == image_to_bytes(Image.fromarray(gray).convert("L"))
+
+
+def test_arrays_to_png_derives_mask_from_rgb():
+    rgb = np.zeros((8, 8, 3), dtype=np.uint8)
+    rgb[..., 0] = 200
+    image_png, mask_png = arrays_to_png(rgb)
+    assert image_png == image_to_bytes(Image.fromarray(rgb))
+    assert mask_png == image_to_bytes(Image.fromarray(rgb).convert("L"))
@@ -0,0 +1,35 @@
+import pytest
+
+from common.io import secure_filename
+
+
+def test_secure_filename_sanitizes_ascii_and_unicode():
+    assert secure_filename("report 2024 (final).pdf") == "report_2024__final.pdf"
+    assert secure_filename("../../etc/passwd") == "etc_passwd"
+    assert secure_filename("scan.ti$f") == "scan.tif"
+    assert secure_filename("résumé.pdf") == "résumé.pdf"
+    assert secure_filename("") == "upload"
+    assert secure_filename("...", fallback="file") == "file"
+
+
+def test_tmpfs_root_recreated_after_removal(tmp_path, monkeypatch):
+    from app import config
+    from common.io import ensure_tmpfs_root, new_tmpfs_dir, reset_tmpfs_cache
+
+    root = tmp_path / "tmpfs"
+    monkeypatch.setattr(config.BaseConfig, "UPLOAD_TMPFS_ROOT", root)
+    reset_tmpfs_cache()
+    assert ensure_tmpfs_root() == root and root.is_dir()
+    root.rmdir()
+    scratch = new_tmpfs_dir()
+    assert root.is_dir() and scratch.path.parent == root
+    scratch.cleanup()
+    reset_tmpfs_cache()
+
+
+def test_tempdir_rejects_unknown_attributes(tmp_path):
+    from common.io import TempDir
+
+    temp_dir = TempDir(tmp_path)
+    with pytest.raises(AttributeError):
+        temp_dir.extra = 1
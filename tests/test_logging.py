@@ -0,0 +1,28 @@
+import logging
+import queue
+
+from common.logging import _DroppingQueueHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        "ml_server_aio", logging.INFO, __file__, 0, message, (), None
+    )
+
+
+def test_dropped_records_reported_once_queue_drains():
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = _DroppingQueueHandler(log_queue)
+    for index in range(5):
+        handler.enqueue(_record(f"record {index}"))
+    assert handler.dropped == 3
+
+    drained = [log_queue.get_nowait().getMessage() for _ in range(2)]
+    assert drained == ["record 0", "record 1"]
+
+    handler.enqueue(_record("after drain"))
+    warning, record = log_queue.get_nowait(), log_queue.get_nowait()
+    assert warning.levelno == logging.WARNING
+    assert warning.getMessage() == "dropped 3 log records while the log queue was full"
+    assert record.getMessage() == "after drain"
+    assert handler.dropped == 0
@@ -0,0 +1,12 @@
+import math
+from datetime import datetime
+
+from app import create_app
+from common.responses import ok
+
+
+def test_ok_encodes_dates_like_flask_and_non_finite_floats_as_null():
+    app = create_app("TestingConfig")
+    with app.app_context():
+        body = ok({"t": datetime(2020, 1, 1), "n": math.nan, "i": math.inf}).get_json()
+    assert body["data"] == {"t": "Wed, 01 Jan 2020 00:00:00 GMT", "n": None, "i": None}
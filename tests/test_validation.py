@@ -0,0 +1,101 @@
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from common.validation import (
+    FileLimit,
+    ValidationError,
+    _memory_buffer,
+    enforce_limits,
+    read_with_limit,
+    validate_mime,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+WEBP = b"RIFF\x00\x00\x00\x00WEBPVP8 "
+CSV = b"a,b\n1,2\n"
+
+
+def _upload(data: bytes, filename: str = "upload.bin") -> FileStorage:
+    return FileStorage(stream=BytesIO(data), filename=filename)
+
+
+@pytest.mark.parametrize(
+    ("data", "allowed"),
+    [
+        (PNG, {"image/png", "image/jpeg"}),
+        (b"%PDF-1.7\n", {"application/pdf"}),
+        (WEBP, {"image/webp"}),
+        (CSV, {"text/csv"}),
+    ],
+)
+def test_validate_mime_accepts_matching_signatures(data, allowed):
+    upload = _upload(data)
+    validate_mime([upload], allowed)
+    assert upload.stream.read() == data
+
+
+@pytest.mark.parametrize(
+    ("data", "allowed"),
+    [
+        (PNG, {"application/pdf"}),
+        (b"%PDF-1.7\n", {"image/png"}),
+        (b"no delimiters here", {"text/csv"}),
+        (b"", {"image/png"}),
+    ],
+)
+def test_validate_mime_rejects_mismatched_signatures(data, allowed):
+    with pytest.raises(ValidationError):
+        validate_mime([_upload(data)], allowed)
+
+
+@pytest.mark.parametrize("max_size", [1 << 20, 8])
+def test_validate_mime_handles_spooled_streams(max_size):
+    stream = SpooledTemporaryFile(max_size=max_size, mode="rb+")
+    stream.write(PNG)
+    stream.seek(0)
+    validate_mime([FileStorage(stream=stream, filename="a.png")], {"image/png"})
+    assert stream.tell() == 0
+    with pytest.raises(ValidationError):
+        validate_mime([FileStorage(stream=stream, filename="a.pdf")], {"text/csv"})
+
+
+@pytest.mark.parametrize("max_size", [1 << 20, 8])
+def test_enforce_limits_measures_spooled_streams(max_size):
+    stream = SpooledTemporaryFile(max_size=max_size, mode="rb+")
+    stream.write(b"x" * 2048)
+    stream.seek(0)
+    upload = FileStorage(stream=stream, filename="a.bin")
+    enforce_limits([upload], FileLimit(max_files=1, max_size=2048))
+    with pytest.raises(ValidationError):
+        enforce_limits([upload], FileLimit(max_files=1, max_size=2047))
+
+
+def test_enforce_limits_rewinds_partially_read_uploads():
+    upload = _upload(b"x" * 64)
+    upload.stream.read(10)
+    enforce_limits([upload], FileLimit(max_files=1, max_size=64))
+    assert upload.stream.tell() == 0
+
+
+def test_memory_buffer_only_for_in_memory_spools():
+    stream = SpooledTemporaryFile(max_size=16, mode="rb+")
+    stream.write(b"x" * 8)
+    assert isinstance(_memory_buffer(stream), BytesIO)
+
+    stream.write(b"x" * 16)
+    assert stream._rolled
+    assert _memory_buffer(stream) is None
+    upload = FileStorage(stream=stream, filename="a.bin")
+    enforce_limits([upload], FileLimit(max_files=1, max_size=24))
+    with pytest.raises(ValidationError):
+        enforce_limits([upload], FileLimit(max_files=1, max_size=23))
+
+
+def test_read_with_limit_returns_bytes_up_to_limit():
+    limit = FileLimit(max_files=1, max_size=2048)
+    assert read_with_limit(_upload(b"x" * 2048), limit) == b"x" * 2048
+    with pytest.raises(ValidationError):
+        read_with_limit(_upload(b"x" * 2049), limit)